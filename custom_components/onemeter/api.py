@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Sequence
 import logging
 from typing import Any, Final, TypedDict, NotRequired, cast
 
@@ -61,16 +62,21 @@ class OneMeterApiResponseDict(TypedDict):
 class OneMeterApiClient:
     """API client for OneMeter Cloud."""
 
-    def __init__(self, device_id: str, api_key: str) -> None:
-        """Initialize the client."""
+    def __init__(
+        self, device_id: str, api_key: str, session: ClientSession | None = None
+    ) -> None:
+        """Initialize the client, optionally on a caller-owned session."""
         self.device_id: Final = device_id
         self.api_key: Final = api_key
-        self._session: ClientSession | None = None
+        self._session: ClientSession | None = session
+        # Only sessions created by the client are closed by it
+        self._owns_session = session is None
 
     async def _create_session(self) -> ClientSession:
         """Create session if needed and return it."""
         if self._session is None or self._session.closed:
             self._session = aiohttp.ClientSession()
+            self._owns_session = True
         return self._session
 
     async def api_call(
@@ -155,7 +161,7 @@ class OneMeterApiClient:
         return await self.api_call(f"devices/{self.device_id}")
 
     async def get_readings(
-        self, count: int = 1, obis_codes: list[str] | None = None
+        self, count: int = 1, obis_codes: Sequence[str] | None = None
     ) -> dict[str, Any]:
         """Get readings data for specific OBIS codes."""
         if obis_codes is None:
@@ -178,41 +184,68 @@ class OneMeterApiClient:
 
         return await self.api_call(f"devices/{self.device_id}/readings", params)
 
-    def extract_device_value(self, data: dict[str, Any], obis_code: str) -> Any:
-        """Extract a value from device data by OBIS code.
-
-        Args:
-            data: Device data from the API
-            obis_code: OBIS code to extract
-
-        Returns:
-            The extracted value or None if not found
-        """
-        if not data or not isinstance(data, dict) or not obis_code:
-            return None
+    def _device_obis(self, data: Any) -> dict[str, Any]:
+        """Return the OBIS mapping of the last reading in device data."""
+        if not data or not isinstance(data, dict):
+            return {}
 
         try:
-            # Try to find the value in different possible data structures
+            # Try to find the OBIS data in different possible data structures
             if RESP_DEVICES in data and isinstance(data[RESP_DEVICES], list) and data[RESP_DEVICES]:
                 device = data[RESP_DEVICES][0]  # Assume first device
                 if isinstance(device, dict) and RESP_LAST_READING in device:
                     last_reading = device[RESP_LAST_READING]
                     if isinstance(last_reading, dict) and RESP_OBIS in last_reading:
                         obis_data = last_reading[RESP_OBIS]
-                        if isinstance(obis_data, dict) and obis_code in obis_data:
-                            return obis_data[obis_code]
+                        if isinstance(obis_data, dict):
+                            return obis_data
 
             # Alternative structure
             elif (RESP_LAST_READING in data and
                   isinstance(data[RESP_LAST_READING], dict) and
                   RESP_OBIS in data[RESP_LAST_READING]):
                 obis_data = data[RESP_LAST_READING][RESP_OBIS]
-                if isinstance(obis_data, dict) and obis_code in obis_data:
-                    return obis_data[obis_code]
+                if isinstance(obis_data, dict):
+                    return obis_data
         except (KeyError, IndexError, TypeError) as err:
-            _LOGGER.debug("Error extracting device value for %s: %s", obis_code, err)
+            _LOGGER.debug("Error extracting device OBIS data: %s", err)
 
-        return None
+        return {}
+
+    def _reading_obis(self, data: Any) -> dict[str, Any]:
+        """Return the OBIS mapping of the most recent reading in readings data."""
+        if not data or not isinstance(data, dict):
+            return {}
+
+        try:
+            if "readings" in data and isinstance(data["readings"], list) and data["readings"]:
+                reading = data["readings"][0]  # Get most recent reading
+                if isinstance(reading, dict) and RESP_OBIS in reading:
+                    obis_data = reading[RESP_OBIS]
+                    if isinstance(obis_data, dict):
+                        return obis_data
+                elif isinstance(reading, dict):
+                    # Direct keys in reading
+                    return reading
+        except (KeyError, IndexError, TypeError) as err:
+            _LOGGER.debug("Error extracting reading OBIS data: %s", err)
+
+        return {}
+
+    def extract_device_value(self, data: dict[str, Any], obis_code: str) -> Any:
+        """Extract a value from device data by OBIS code.
+
+        Args:
+            data: Device data from the API
+            obis_code: OBIS code to extract
+
+        Returns:
+            The extracted value or None if not found
+        """
+        if not obis_code:
+            return None
+
+        return self._device_obis(data).get(obis_code)
 
     def extract_reading_value(self, data: dict[str, Any], obis_code: str) -> Any:
         """Extract a value from readings data by OBIS code.
@@ -224,23 +257,37 @@ class OneMeterApiClient:
         Returns:
             The extracted value or None if not found
         """
-        if not data or not isinstance(data, dict) or not obis_code:
+        if not obis_code:
             return None
 
-        try:
-            if "readings" in data and isinstance(data["readings"], list) and data["readings"]:
-                reading = data["readings"][0]  # Get most recent reading
-                if isinstance(reading, dict) and RESP_OBIS in reading:
-                    obis_data = reading[RESP_OBIS]
-                    if isinstance(obis_data, dict) and obis_code in obis_data:
-                        return obis_data[obis_code]
-                elif isinstance(reading, dict) and obis_code in reading:
-                    # Direct key in reading
-                    return reading[obis_code]
-        except (KeyError, IndexError, TypeError) as err:
-            _LOGGER.debug("Error extracting reading value for %s: %s", obis_code, err)
+        return self._reading_obis(data).get(obis_code)
 
-        return None
+    def get_obis_values(
+        self, device_data: dict[str, Any], readings_data: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        """Get all OBIS values from device and readings data as one flat dict.
+
+        Values from device data take precedence; readings data only fills
+        in codes that device data does not provide.
+
+        Args:
+            device_data: Device data from the API
+            readings_data: Readings data from the API, may be None
+
+        Returns:
+            Mapping of OBIS codes to their non-None values
+        """
+        values = {
+            obis_code: value
+            for obis_code, value in self._reading_obis(readings_data).items()
+            if value is not None
+        }
+        values.update(
+            (obis_code, value)
+            for obis_code, value in self._device_obis(device_data).items()
+            if value is not None
+        )
+        return values
 
     def get_this_month_usage(self, data: dict[str, Any]) -> float | None:
         """Get this month's usage from device data.
@@ -327,5 +374,6 @@ class OneMeterApiClient:
     async def close(self) -> None:
         """Close open client session."""
         if self._session:
-            await self._session.close()
+            if self._owns_session:
+                await self._session.close()
             self._session = None
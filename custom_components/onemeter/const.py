@@ -22,9 +22,19 @@ REFRESH_INTERVAL_5 = 5
 REFRESH_INTERVAL_15 = 15
 DEFAULT_REFRESH_INTERVAL = REFRESH_INTERVAL_15
 
+# Refresh interval for rarely changing values (in minutes)
+SLOW_REFRESH_INTERVAL = 24 * 60
+
+# Retry interval after a failed slow refresh (in minutes)
+SLOW_RETRY_INTERVAL = DEFAULT_REFRESH_INTERVAL
+
 # Update offset in seconds (refresh at XX:00:30, XX:15:30, etc.)
 UPDATE_OFFSET_SECONDS = 30
 
+# Offset of the daily update in seconds (refresh at 00:07:45 UTC), clear of
+# every XX:XX:30 fast update so the two never hit the API together
+SLOW_UPDATE_OFFSET_SECONDS = 7 * 60 + 45
+
 # Platforms
 PLATFORMS = [Platform.SENSOR]
 
@@ -163,11 +173,37 @@ SENSOR_TO_OBIS_MAP: dict[str, str] = {
     "energy_consumption_blink": OBIS_ENERGY_CONSUMPTION_BLINK,
 }
 
+# Sensors whose values rarely change, polled at SLOW_REFRESH_INTERVAL; the
+# firmware, hardware and MAC values have no sensors and only feed the device
+# registry entry built from the slow coordinator's data
+SLOW_SENSOR_KEYS = frozenset(
+    {
+        "meter_serial",
+        "optical_port_serial",
+        "uart_params",
+        "ir_power",
+        "baud_rate",
+        "physical_address",
+        "firmware_version",
+        "hardware_version",
+        "mac_address",
+    }
+)
+
+# Sensor to OBIS maps split by polling frequency
+FAST_SENSOR_TO_OBIS_MAP: dict[str, str] = {
+    key: code for key, code in SENSOR_TO_OBIS_MAP.items() if key not in SLOW_SENSOR_KEYS
+}
+SLOW_SENSOR_TO_OBIS_MAP: dict[str, str] = {
+    key: code for key, code in SENSOR_TO_OBIS_MAP.items() if key in SLOW_SENSOR_KEYS
+}
+
 # API Configuration
 API_BASE_URL = "https://cloud.onemeter.com/api/"
 API_TIMEOUT = 30
 API_RETRY_ATTEMPTS = 3
 API_RETRY_DELAY = 2  # seconds between retry attempts
+UPDATE_TIMEOUT = 50  # seconds per refresh, below the shortest refresh interval
 
 # Icons
 ICON_ENERGY = "mdi:lightning-bolt"
@@ -2,23 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 import logging
+import time
 from typing import Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.util import dt as dt_util
 
 from .api import OneMeterApiClient
 from .const import (
+    FAST_SENSOR_TO_OBIS_MAP,
     OBIS_FIRMWARE_VERSION,
     OBIS_HARDWARE_VERSION,
     OBIS_MAC_ADDRESS,
     OBIS_METER_SERIAL,
     OBIS_PHYSICAL_ADDRESS,
-    SENSOR_TO_OBIS_MAP,
+    SLOW_RETRY_INTERVAL,
+    SLOW_SENSOR_TO_OBIS_MAP,
+    SLOW_UPDATE_OFFSET_SECONDS,
     UPDATE_OFFSET_SECONDS,
+    UPDATE_TIMEOUT,
 )
 from .helpers import calculate_battery_percentage
 
@@ -56,6 +61,21 @@ def _validate_api_data(device_data: Any, readings_data: Any) -> None:
 class OneMeterUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to coordinate updates for OneMeter sensors."""
 
+    __slots__ = (
+        "client",
+        "device_id",
+        "_refresh_interval_minutes",
+        "_next_tick",
+        "_previous",
+        "changed_keys",
+    )
+
+    # Sensors fed by this coordinator and the unique OBIS codes it polls
+    _sensor_obis_items = tuple(FAST_SENSOR_TO_OBIS_MAP.items())
+    _obis_codes = tuple(dict.fromkeys(FAST_SENSOR_TO_OBIS_MAP.values()))
+    # Seconds past each interval boundary at which the update runs
+    _update_offset = UPDATE_OFFSET_SECONDS
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -68,6 +88,11 @@ class OneMeterUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.client = client
         self.device_id = device_id
         self._refresh_interval_minutes = refresh_interval
+        # Epoch second of the next synchronized update, reused until it passes
+        self._next_tick = 0
+        # Values of the last update and the sensor keys that differ from them
+        self._previous: dict[str, Any] = {}
+        self.changed_keys: frozenset[str] = frozenset()
 
         # Calculate the next update time for synchronized updates
         update_interval = self._calculate_update_interval()
@@ -77,27 +102,27 @@ class OneMeterUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER,
             name=name,
             update_interval=update_interval,
+            # Only notify entities when the polled values actually changed
+            always_update=False,
         )
 
     def _calculate_update_interval(self) -> timedelta:
         """Calculate the time until the next synchronized update."""
-        now = dt_util.now()
-
-        # Calculate minutes until the next interval (1, 5, or 15 min)
-        minutes_to_sync = self._refresh_interval_minutes - (
-            now.minute % self._refresh_interval_minutes
-        )
+        period = self._refresh_interval_minutes * 60
+        now = int(time.time())
 
-        # If we're already at an exact interval, use the full interval delay
-        if minutes_to_sync == self._refresh_interval_minutes:
-            minutes_to_sync = 0
+        # The scheduled tick stays valid while it is 5 seconds to one period away
+        if 5 <= self._next_tick - now <= period:
+            return timedelta(seconds=self._next_tick - now)
 
-        # Calculate seconds until the next interval + offset seconds
-        seconds_to_sync = (minutes_to_sync * 60) - now.second + UPDATE_OFFSET_SECONDS
+        # Seconds until the next interval boundary (1, 5, or 15 min) + offset seconds
+        seconds_to_sync = (self._update_offset - now) % period
 
         # If we're too close to the next update time, add a full interval
         if seconds_to_sync < 5:  # If less than 5 seconds away
-            seconds_to_sync += self._refresh_interval_minutes * 60
+            seconds_to_sync += period
+
+        self._next_tick = now + seconds_to_sync
 
         _LOGGER.debug(
             "Calculated update interval: %s minutes, %s seconds to next sync",
@@ -110,86 +135,56 @@ class OneMeterUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data via API and schedule next update at fixed intervals."""
         try:
-            # Get device data - essential for most readings
-            device_data = await self.client.get_device_data()
+            # The API has no combined endpoint, so fetch device data (essential
+            # for most readings) and detailed readings concurrently, bounded so
+            # a hung API cannot stall the refresh past the next scheduled one
+            try:
+                async with asyncio.timeout(UPDATE_TIMEOUT):
+                    device_data, readings_data = await asyncio.gather(
+                        self.client.get_device_data(),
+                        self.client.get_readings(1, self._obis_codes),
+                        return_exceptions=True,
+                    )
+            except TimeoutError as err:
+                raise UpdateFailed(
+                    f"Timed out after {UPDATE_TIMEOUT}s fetching OneMeter data"
+                ) from err
+
+            # Device data is essential, readings only complement it
+            if isinstance(device_data, BaseException):
+                raise device_data
+            if isinstance(readings_data, BaseException):
+                _LOGGER.warning("Error fetching OneMeter readings: %s", readings_data)
+                readings_data = {}
 
             # Simplified validation
             if not device_data or not isinstance(device_data, dict):
                 raise UpdateFailed("Invalid or missing device data from OneMeter API")
 
-            # Get detailed readings only if needed and device data is valid
-            all_obis_codes = list(set(SENSOR_TO_OBIS_MAP.values()))
-            # Consider making this call optional or based on needed sensors
-            readings_data = await self.client.get_readings(1, all_obis_codes)
-
             # Validate API data
             _validate_api_data(device_data, readings_data)
 
-            # Process data if successful
-            data: dict[str, Any] = {}
-
-            # Extract device information for device registry
-            self._extract_device_info(data, device_data, readings_data)
-
-            # Extract all values from device data and readings
-            for sensor_key, obis_code in SENSOR_TO_OBIS_MAP.items():
-                # Try to get the value from device data first
-                value = self.client.extract_device_value(device_data, obis_code)
-
-                # If not found, try to get from readings data
-                if value is None and readings_data:
-                    value = self.client.extract_reading_value(readings_data, obis_code)
-
-                if value is not None:
-                    data[sensor_key] = value
-
-            # Parse and add the separated IR power and baud rate values
-            if "uart_params" in data and isinstance(data["uart_params"], str):
-                uart_value = data["uart_params"]
-                try:
-                    # Parse formats like "3/300" or other variants
-                    if "/" in uart_value:
-                        parts = uart_value.split("/", 1)
-                        if len(parts) == 2:
-                            ir_power, baud_rate = parts
-                            data["ir_power"] = ir_power.strip()
-                            # Ensure baud rate is a numeric value
-                            data["baud_rate"] = int(baud_rate.strip())
-                except (ValueError, TypeError) as err:
-                    _LOGGER.debug("Could not parse UART parameters: %s - %s", uart_value, err)
-            elif "uart_params" in data and isinstance(data["uart_params"], list):
-                # Handle case where uart_params might be a list like [7, 9600]
-                try:
-                    uart_list = data["uart_params"]
-                    if len(uart_list) >= 2:
-                        # First element is typically IR power, second is baud rate
-                        data["ir_power"] = str(uart_list[0])
-                        data["baud_rate"] = int(uart_list[1]) if isinstance(uart_list[1], (int, float, str)) else None
-                except (IndexError, ValueError, TypeError) as err:
-                    _LOGGER.debug("Could not parse UART parameters list: %s - %s", data["uart_params"], err)
-
-            # Add battery percentage calculated from battery voltage
-            try:
-                if "battery_voltage" in data and isinstance(
-                    data["battery_voltage"], (int, float)
-                ):
-                    data["battery_percentage"] = calculate_battery_percentage(
-                        data["battery_voltage"]
-                    )
-            except Exception as err:
-                _LOGGER.debug("Error calculating battery percentage: %s", err)
-
-            # Extract monthly usage data if available
-            try:
-                monthly_data = {
-                    "this_month": self.client.get_this_month_usage(device_data),
-                    "previous_month": self.client.get_previous_month_usage(device_data),
-                }
-
-                # Only add non-None values to the data dictionary
-                data.update({k: v for k, v in monthly_data.items() if v is not None})
-            except Exception as err:
-                _LOGGER.debug("Error extracting monthly usage data: %s", err)
+            # Flatten the OBIS values of device data and readings once
+            obis_values = self.client.get_obis_values(device_data, readings_data)
+
+            # Extract all sensor values from the flattened OBIS values
+            data: dict[str, Any] = {
+                sensor_key: value
+                for sensor_key, obis_code in self._sensor_obis_items
+                if (value := obis_values.get(obis_code)) is not None
+            }
+
+            # Add the values derived from the raw readings
+            self._add_derived_values(data, device_data, obis_values)
+
+            # Record which values changed so entities can skip unchanged writes
+            previous = self._previous
+            self.changed_keys = frozenset(
+                key
+                for key in data.keys() | previous.keys()
+                if data.get(key) != previous.get(key)
+            )
+            self._previous = data
 
             # Schedule the next update at a precisely timed interval
             next_update = self._calculate_update_interval()
@@ -207,8 +202,35 @@ class OneMeterUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.error("Error updating OneMeter data: %s", err)
             raise UpdateFailed(f"Error communicating with OneMeter API: {err}") from err
 
+    def _add_derived_values(
+        self, data: dict[str, Any], device_data: dict[str, Any], obis_values: dict[str, Any]
+    ) -> None:
+        """Add battery percentage and monthly usage to the sensor values."""
+        # Add battery percentage calculated from battery voltage
+        try:
+            if "battery_voltage" in data and isinstance(
+                data["battery_voltage"], (int, float)
+            ):
+                data["battery_percentage"] = calculate_battery_percentage(
+                    data["battery_voltage"]
+                )
+        except Exception as err:
+            _LOGGER.debug("Error calculating battery percentage: %s", err)
+
+        # Extract monthly usage data if available
+        try:
+            monthly_data = {
+                "this_month": self.client.get_this_month_usage(device_data),
+                "previous_month": self.client.get_previous_month_usage(device_data),
+            }
+
+            # Only add non-None values to the data dictionary
+            data.update({k: v for k, v in monthly_data.items() if v is not None})
+        except Exception as err:
+            _LOGGER.debug("Error extracting monthly usage data: %s", err)
+
     def _extract_device_info(
-        self, data: dict[str, Any], device_data: dict[str, Any], readings_data: dict[str, Any] | None
+        self, data: dict[str, Any], device_data: dict[str, Any], obis_values: dict[str, Any]
     ) -> None:
         """Extract device information for device registry.
 
@@ -218,7 +240,7 @@ class OneMeterUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Args:
             data: Target data dictionary to update with extracted values
             device_data: Device data from the API
-            readings_data: Readings data from the API, may be None
+            obis_values: Flattened OBIS values of device and readings data
         """
         # Define important device info fields to extract
         device_info_fields = {
@@ -229,14 +251,9 @@ class OneMeterUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "physical_address": OBIS_PHYSICAL_ADDRESS,
         }
 
-        # Extract device information with multiple fallback sources
+        # Extract device information from the OBIS values first
         for field, obis_code in device_info_fields.items():
-            # Try to extract from device_data first
-            value = self.client.extract_device_value(device_data, obis_code)
-
-            # If not found in device_data, try readings_data
-            if value is None and readings_data:
-                value = self.client.extract_reading_value(readings_data, obis_code)
+            value = obis_values.get(obis_code)
 
             # If we found a value, store it
             if value is not None:
@@ -280,3 +297,59 @@ class OneMeterUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     data["meter_serial"] = device_data[field]
                     _LOGGER.debug("Found meter serial in field: %s", field)
                     break
+
+
+class OneMeterSlowCoordinator(OneMeterUpdateCoordinator):
+    """Class to coordinate updates for rarely changing OneMeter values.
+
+    Serial numbers, firmware versions and UART parameters hardly ever change,
+    so they are polled separately at SLOW_REFRESH_INTERVAL to keep the
+    frequent readings requests small. Its data also carries the device
+    information used for the device registry entry.
+    """
+
+    _sensor_obis_items = tuple(SLOW_SENSOR_TO_OBIS_MAP.items())
+    _obis_codes = tuple(dict.fromkeys(SLOW_SENSOR_TO_OBIS_MAP.values()))
+    _update_offset = SLOW_UPDATE_OFFSET_SECONDS
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Update data, retrying a failed refresh well before the next day."""
+        try:
+            return await super()._async_update_data()
+        except UpdateFailed:
+            # The interval is only recalculated on success, so a failure would
+            # otherwise wait the whole day; success restores the daily tick
+            self.update_interval = timedelta(minutes=SLOW_RETRY_INTERVAL)
+            raise
+
+    def _add_derived_values(
+        self, data: dict[str, Any], device_data: dict[str, Any], obis_values: dict[str, Any]
+    ) -> None:
+        """Add device information and the split UART parameters."""
+        # Extract device information for device registry
+        self._extract_device_info(data, device_data, obis_values)
+
+        # Parse and add the separated IR power and baud rate values
+        if "uart_params" in data and isinstance(data["uart_params"], str):
+            uart_value = data["uart_params"]
+            try:
+                # Parse formats like "3/300" or other variants
+                if "/" in uart_value:
+                    parts = uart_value.split("/", 1)
+                    if len(parts) == 2:
+                        ir_power, baud_rate = parts
+                        data["ir_power"] = ir_power.strip()
+                        # Ensure baud rate is a numeric value
+                        data["baud_rate"] = int(baud_rate.strip())
+            except (ValueError, TypeError) as err:
+                _LOGGER.debug("Could not parse UART parameters: %s - %s", uart_value, err)
+        elif "uart_params" in data and isinstance(data["uart_params"], list):
+            # Handle case where uart_params might be a list like [7, 9600]
+            try:
+                uart_list = data["uart_params"]
+                if len(uart_list) >= 2:
+                    # First element is typically IR power, second is baud rate
+                    data["ir_power"] = str(uart_list[0])
+                    data["baud_rate"] = int(uart_list[1]) if isinstance(uart_list[1], (int, float, str)) else None
+            except (IndexError, ValueError, TypeError) as err:
+                _LOGGER.debug("Could not parse UART parameters list: %s - %s", data["uart_params"], err)
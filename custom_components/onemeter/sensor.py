@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from homeassistant.components.sensor import (
@@ -12,7 +13,6 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
-    CONF_API_KEY,
     CONF_DEVICE_ID,
     CONF_NAME,
     PERCENTAGE,
@@ -20,15 +20,22 @@ from homeassistant.const import (
     UnitOfEnergy,
     UnitOfPower,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-from homeassistant.helpers.typing import StateType
 
 from .api import OneMeterApiClient
-from .const import CONF_REFRESH_INTERVAL, DEFAULT_REFRESH_INTERVAL, UNIT_REACTIVE_ENERGY
-from .coordinator import OneMeterUpdateCoordinator
-from .entity import OneMeterEntity
+from .const import (
+    CONF_REFRESH_INTERVAL,
+    DEFAULT_REFRESH_INTERVAL,
+    DOMAIN,
+    SLOW_REFRESH_INTERVAL,
+    SLOW_SENSOR_KEYS,
+    UNIT_REACTIVE_ENERGY,
+)
+from .coordinator import OneMeterSlowCoordinator, OneMeterUpdateCoordinator
+from .entity import OneMeterEntity, build_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -360,6 +367,18 @@ SENSOR_TYPES: dict[str, SensorEntityDescription] = {
     ),
 }
 
+# Sensor descriptions per coordinator, walked once when creating the entities
+_FAST_SENSOR_DESCRIPTIONS = tuple(
+    description
+    for key, description in SENSOR_TYPES.items()
+    if key not in SLOW_SENSOR_KEYS
+)
+_SLOW_SENSOR_DESCRIPTIONS = tuple(
+    description
+    for key, description in SENSOR_TYPES.items()
+    if key in SLOW_SENSOR_KEYS
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -367,7 +386,6 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up the OneMeter sensors."""
-    api_key = config_entry.data[CONF_API_KEY]
     device_id = config_entry.data[CONF_DEVICE_ID]
 
     # Get the refresh interval from options (default to 15 minutes)
@@ -375,10 +393,10 @@ async def async_setup_entry(
         CONF_REFRESH_INTERVAL, DEFAULT_REFRESH_INTERVAL
     )
 
-    # Create API client
-    client = OneMeterApiClient(device_id=device_id, api_key=api_key)
+    # Reuse the API client created and verified during entry setup
+    client: OneMeterApiClient = hass.data[DOMAIN][config_entry.entry_id]
 
-    # Create update coordinator
+    # Create update coordinators for frequently and rarely changing values
     coordinator = OneMeterUpdateCoordinator(
         hass,
         client=client,
@@ -386,26 +404,76 @@ async def async_setup_entry(
         name=config_entry.data.get(CONF_NAME, device_id),
         device_id=device_id,
     )
+    slow_coordinator = OneMeterSlowCoordinator(
+        hass,
+        client=client,
+        refresh_interval=SLOW_REFRESH_INTERVAL,
+        name=config_entry.data.get(CONF_NAME, device_id),
+        device_id=device_id,
+    )
 
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    # Fetch initial data concurrently; only the frequently polled values are
+    # essential, a failed refresh of the rarely changing ones is retried later
+    await asyncio.gather(
+        coordinator.async_config_entry_first_refresh(),
+        slow_coordinator.async_refresh(),
+    )
+
+    # Device information is the same for every entity of this entry and comes
+    # from the rarely changing values, falling back to the device ID until
+    # they are available
+    device_info = build_device_info(device_id, slow_coordinator.data)
+
+    def _build_entities(
+        sensor_coordinator: OneMeterUpdateCoordinator,
+        descriptions: tuple[SensorEntityDescription, ...],
+    ) -> list[OneMeterSensor]:
+        """Create entities for the values available from a coordinator."""
+        return [
+            OneMeterSensor(
+                sensor_coordinator,
+                description,
+                config_entry.entry_id,
+                device_id,
+                device_info=device_info,
+            )
+            for description in descriptions
+            if description.key in (sensor_coordinator.data or {})
+        ]
 
-    # Create entities for available data
-    entities = []
-    for sensor_key, description in SENSOR_TYPES.items():
-        if coordinator.data and sensor_key in coordinator.data:
-            entities.append(
-                OneMeterSensor(
-                    coordinator, description, config_entry.entry_id, device_id
-                )
+    entities = _build_entities(coordinator, _FAST_SENSOR_DESCRIPTIONS)
+
+    if slow_coordinator.last_update_success:
+        entities.extend(_build_entities(slow_coordinator, _SLOW_SENSOR_DESCRIPTIONS))
+    else:
+        # Add the rarely changing sensors once a retried refresh succeeds; the
+        # listener also keeps the slow coordinator polling until then
+        slow_added = False
+
+        @callback
+        def _async_add_slow_entities() -> None:
+            nonlocal slow_added, device_info
+            if slow_added or not slow_coordinator.last_update_success:
+                return
+            slow_added = True
+            # Refresh the device information now that it is available
+            device_info = build_device_info(device_id, slow_coordinator.data)
+            async_add_entities(
+                _build_entities(slow_coordinator, _SLOW_SENSOR_DESCRIPTIONS)
             )
 
+        config_entry.async_on_unload(
+            slow_coordinator.async_add_listener(_async_add_slow_entities)
+        )
+
     async_add_entities(entities)
 
 
 class OneMeterSensor(OneMeterEntity, SensorEntity):
     """Representation of a OneMeter sensor."""
 
+    __slots__ = ("_key",)
+
     entity_description: SensorEntityDescription
 
     def __init__(
@@ -414,15 +482,18 @@ class OneMeterSensor(OneMeterEntity, SensorEntity):
         description: SensorEntityDescription,
         entry_id: str,
         device_id: str,
+        device_info: DeviceInfo | None = None,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, device_id)
+        super().__init__(coordinator, device_id, device_info)
         self.entity_description = description
+        self._key = description.key
         self._attr_unique_id = f"{entry_id}_{description.key}"
+        self._attr_native_value = (coordinator.data or {}).get(self._key)
 
-    @property
-    def native_value(self) -> StateType:
-        """Return the state of the sensor."""
-        if self.coordinator.data:
-            return self.coordinator.data.get(self.entity_description.key)
-        return None
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update and write the state only when this sensor's value changed."""
+        if self._key in self.coordinator.changed_keys:
+            self._attr_native_value = (self.coordinator.data or {}).get(self._key)
+            self.async_write_ha_state()
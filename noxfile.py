@@ -54,6 +54,20 @@ def linkcheck(session):
     )
 
 
+@nox.session
+def tests(session):
+    """Run the full test suite."""
+    session.install("-r", "requirements.tests.txt")
+    session.run("pytest", *session.posargs)
+
+
+@nox.session
+def tests_fast(session):
+    """Run the test suite without the slow integration-style tests."""
+    session.install("-r", "requirements.tests.txt")
+    session.run("pytest", "-m", "not slow", *session.posargs)
+
+
 def install_with_constraints(session, *args, **kwargs):
     """Install packages constrained by Poetry's lock file."""
     with tempfile.NamedTemporaryFile() as requirements:
@@ -2,85 +2,282 @@
 
 from __future__ import annotations
 
-import os
-import sys
-from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, NamedTuple
+from unittest.mock import MagicMock, patch
 
 import pytest
-
-# Add the custom_components directory to the Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
-
-# Now we can import the components after path setup
-from custom_components.onemeter.api import OneMeterApiClient
+import pytest_asyncio
 
 # Mock API responses
 MOCK_DEVICE_ID = "device123456"
 MOCK_API_KEY = "api_key_12345"
 
+# Canned API responses shared by all tests; the coordinator validates these
+# as dicts, so they cannot be wrapped in a MappingProxyType
+_DEVICE_DATA = {
+    "OBIS": {
+        "1_8_0": {"value": 1234.56},  # Energy plus
+        "2_8_0": {"value": 0.0},      # Energy minus
+        "S_1_1_2": {"value": 3.6},    # Battery voltage
+    },
+    "lastReading": {
+        "timestamp": 1675000000
+    }
+}
 
-@pytest.fixture
-def mock_onemeter_client():
-    """Mock the OneMeter API client."""
-    client = MagicMock(spec=OneMeterApiClient)
+_READINGS = {
+    "readings": [
+        {
+            "timestamp": 1675000000,
+            "OBIS": {
+                "1_8_0": {"value": 1234.56},
+                "16_7_0": {"value": 2.5}  # Power
+            }
+        }
+    ]
+}
+
+# Read-only so a test mutating the shared values fails loudly
+_OBIS_VALUES = MappingProxyType(
+    {"1_8_0": 1234.56, "2_8_0": 0.0, "S_1_1_2": 3.6, "16_7_0": 2.5}
+)
+
+
+# Coordinator data shared by the sensor tests, read-only as no test changes it
+COORDINATOR_DATA = MappingProxyType({
+    "energy_plus": 12345.67,
+    "energy_minus": 0.0,
+    "energy_r1": 10.5,
+    "energy_r4": 3.2,
+    "energy_abs": 12345.67,
+    "power": 2.5,
+    "battery_voltage": 3.6,
+    "battery_percentage": 95,
+    "meter_serial": "11722779",
+    "tariff": "G11",
+    "this_month": 123.45,
+    "previous_month": 234.56,
+})
+
+
+class _StubApiClient:
+    """Stub OneMeter API client returning canned data without call tracking."""
+
+    device_id = MOCK_DEVICE_ID
+    api_key = MOCK_API_KEY
+
+    async def get_device_data(self):
+        return _DEVICE_DATA
+
+    async def get_readings(self, *args, **kwargs):
+        return _READINGS
+
+    def get_obis_values(self, device_data, readings_data):
+        return _OBIS_VALUES
+
+    def get_this_month_usage(self, device_data):
+        return 350.75
+
+    def get_previous_month_usage(self, device_data):
+        return 425.25
+
+    async def close(self):
+        pass
+
+
+def _prime_api_client(client):
+    """Give the API client mock its canned identity and responses."""
     client.device_id = MOCK_DEVICE_ID
     client.api_key = MOCK_API_KEY
 
     # Mock async methods
-    client.get_device_data = AsyncMock(
-        return_value={
-            "OBIS": {
-                "1_8_0": {"value": 1234.56},  # Energy plus
-                "2_8_0": {"value": 0.0},      # Energy minus
-                "S_1_1_2": {"value": 3.6},    # Battery voltage
-            },
-            "lastReading": {
-                "timestamp": 1675000000
-            }
-        }
-    )
+    client.get_device_data.return_value = _DEVICE_DATA
+    client.get_readings.return_value = _READINGS
+
+    client.get_this_month_usage.return_value = 350.75
+    client.get_previous_month_usage.return_value = 425.25
+
+    client.get_obis_values.return_value = _OBIS_VALUES
+
+
+@pytest.fixture(scope="session")
+def mock_api_client():
+    """Mock the OneMeter API client, built once per session."""
+    # Imported here as the integration package pulls in Home Assistant
+    from custom_components.onemeter.api import OneMeterApiClient
+
+    client = MagicMock(spec=OneMeterApiClient)
+    _prime_api_client(client)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_api_client(request):
+    """Drop calls and values a test left on the shared API client mock."""
+    yield
+    if "mock_api_client" in request.fixturenames:
+        client = request.getfixturevalue("mock_api_client")
+        client.reset_mock(return_value=True, side_effect=True)
+        _prime_api_client(client)
+
+
+@pytest.fixture
+def stub_api_client():
+    """Stub OneMeter API client for tests that do not inspect calls."""
+    return _StubApiClient()
+
+
+class _FakeResponse(NamedTuple):
+    """Minimal aiohttp response with a status and a JSON payload."""
+
+    status: int
+    payload: Any
+
+    async def json(self):
+        return self.payload
 
-    client.get_readings = AsyncMock(
-        return_value={
-            "readings": [
-                {
-                    "timestamp": 1675000000,
-                    "OBIS": {
-                        "1_8_0": {"value": 1234.56},
-                        "16_7_0": {"value": 2.5}  # Power
-                    }
-                }
-            ]
+    async def text(self):
+        return str(self.payload)
+
+
+class _FakeSession:
+    """Fake aiohttp session serving queued responses from get."""
+
+    closed = False
+
+    def __init__(self):
+        self._responses = deque()
+        self.get = MagicMock(side_effect=self._get)
+
+    def respond(self, *responses):
+        """Queue (status, payload) pairs or exceptions for the next gets.
+
+        The last response is served again once the others are used up, and
+        exceptions are raised instead of returned.
+        """
+        self._responses = deque(
+            response if isinstance(response, BaseException)
+            else _FakeResponse(*response)
+            for response in responses
+        )
+
+    @asynccontextmanager
+    async def _get(self, url, **kwargs):
+        queue = self._responses
+        response = queue.popleft() if len(queue) > 1 else queue[0]
+        if isinstance(response, BaseException):
+            raise response
+        yield response
+
+
+@pytest.fixture
+def fake_session():
+    """Fake aiohttp session for the API client tests."""
+    return _FakeSession()
+
+
+def _prime_coordinator(coordinator):
+    """Give the coordinator mock its canned name and data."""
+    coordinator.name = "Test OneMeter"
+    coordinator.device_id = MOCK_DEVICE_ID
+    coordinator.data = COORDINATOR_DATA
+    coordinator.changed_keys = frozenset()
+
+
+@pytest.fixture(scope="session")
+def done_future():
+    """Build already-resolved futures to stand in for single-await coroutines.
+
+    Exceptions passed as the result are set on the future and raised when
+    it is awaited.
+    """
+
+    def _done_future(result: Any) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        if isinstance(result, BaseException):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+        return future
+
+    return _done_future
+
+
+@pytest.fixture(scope="session")
+def coordinator_data():
+    """Canned coordinator data shared by the sensor tests."""
+    return COORDINATOR_DATA
+
+
+@pytest.fixture(scope="session")
+def mock_coordinator():
+    """Mock the OneMeter update coordinator, built once per session."""
+    from custom_components.onemeter.coordinator import OneMeterUpdateCoordinator
+
+    coordinator = MagicMock(spec=OneMeterUpdateCoordinator)
+    _prime_coordinator(coordinator)
+    return coordinator
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_coordinator(request):
+    """Restore the shared coordinator mock after a test changed it."""
+    yield
+    if "mock_coordinator" in request.fixturenames:
+        coordinator = request.getfixturevalue("mock_coordinator")
+        coordinator.reset_mock(return_value=True, side_effect=True)
+        _prime_coordinator(coordinator)
+
+
+@dataclass(frozen=True)
+class _FakeEntry:
+    """Lightweight stand-in for a OneMeter config entry."""
+
+    entry_id: str = "test_entry_id"
+    domain: str = "onemeter"
+    title: str = "Test OneMeter"
+    unique_id: str = MOCK_DEVICE_ID
+    data: dict[str, Any] = field(
+        default_factory=lambda: {
+            "device_id": MOCK_DEVICE_ID,
+            "api_key": MOCK_API_KEY,
+            "name": "Test OneMeter",
         }
     )
+    options: dict[str, Any] = field(
+        default_factory=lambda: {"refresh_interval": 15}
+    )
 
-    client.get_this_month_usage = MagicMock(return_value=350.75)
-    client.get_previous_month_usage = MagicMock(return_value=425.25)
-    client.extract_device_value = MagicMock(return_value=None)
-    client.extract_reading_value = MagicMock(return_value=None)
+    def add_update_listener(self, listener):
+        return lambda: None
 
-    # Set up specific mock values for key attributes
-    def extract_device_value_side_effect(data, obis_code):
-        if obis_code == "1_8_0":
-            return 1234.56
-        elif obis_code == "2_8_0":
-            return 0.0
-        elif obis_code == "S_1_1_2":
-            return 3.6
-        return None
+    def async_on_unload(self, func):
+        pass
 
-    def extract_reading_value_side_effect(data, obis_code):
-        if obis_code == "16_7_0":
-            return 2.5
-        return None
 
-    client.extract_device_value.side_effect = extract_device_value_side_effect
-    client.extract_reading_value.side_effect = extract_reading_value_side_effect
+_CONFIG_ENTRY = _FakeEntry()
 
-    client.close = AsyncMock()
 
-    return client
+@pytest.fixture(scope="session")
+def mock_config_entry():
+    """Mock a OneMeter config entry."""
+    return _CONFIG_ENTRY
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def session_hass():
+    """Home Assistant instance shared by the read-only tests of a session."""
+    from pytest_homeassistant_custom_component.common import (
+        async_test_home_assistant,
+    )
+
+    async with async_test_home_assistant() as hass:
+        yield hass
 
 
 @pytest.fixture
@@ -95,16 +292,25 @@ def hass_config_entries():
     return {}
 
 
-@pytest.fixture
-def mock_get_available_devices():
-    """Mock the get_available_devices function."""
+@pytest.fixture(scope="session")
+def _available_devices_patch():
+    """Patch get_available_devices once for the whole session."""
     with patch(
-        "custom_components.onemeter.config_flow.get_available_devices",
-        return_value=[
-            {
-                "_id": MOCK_DEVICE_ID,
-                "info": {"name": "My OneMeter Device"}
-            }
-        ],
+        "custom_components.onemeter.config_flow.get_available_devices"
     ) as mock:
         yield mock
+
+
+@pytest.fixture
+def mock_get_available_devices(_available_devices_patch):
+    """Mock the get_available_devices function."""
+    # Drop the calls and values set by earlier tests
+    mock = _available_devices_patch
+    mock.reset_mock(return_value=True, side_effect=True)
+    mock.return_value = [
+        {
+            "_id": MOCK_DEVICE_ID,
+            "info": {"name": "My OneMeter Device"}
+        }
+    ]
+    return mock
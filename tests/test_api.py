@@ -1,169 +1,163 @@
 """Tests for the OneMeter API client."""
-import unittest
-from unittest.mock import patch, MagicMock, AsyncMock
+import copy
+from unittest.mock import AsyncMock
 
 import pytest
 
 from custom_components.onemeter.api import OneMeterApiClient, OBIS_ENERGY_PLUS, OBIS_POWER
+from custom_components.onemeter.const import API_BASE_URL
 
+# None of these tests need Home Assistant, so they can share one event loop
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-class TestOneMeterApiClient(unittest.TestCase):
+
+_DEVICE_DATA_JSON = {
+    "lastReading": {
+        "OBIS": {
+            "1_8_0": 12345.67,  # Energy Plus
+            "16_7_0": 2.5,  # Power
+            "S_1_1_2": 3.6,  # Battery voltage
+        }
+    },
+    "usage": {
+        "thisMonth": 123.45,
+        "previousMonth": 234.56,
+    }
+}
+
+_READINGS_JSON = {
+    "readings": [
+        {
+            "1_8_0": 12345.67,
+            "date": "2023-01-01T00:00:00.000Z"
+        }
+    ],
+    "meta": {
+        "OBIS": {
+            "1_8_0": {
+                "key": "POSITIVE_ACTIVE_ENERGY_TOTAL"
+            }
+        }
+    }
+}
+
+
+# Client shared by the extractor tests, which never touch the session
+_CLIENT = OneMeterApiClient(device_id="test-device-id", api_key="test-api-key")
+
+
+class TestOneMeterApiClient:
     """Test the OneMeter API client."""
 
-    def setUp(self):
-        """Set up test variables."""
-        self.device_id = "test-device-id"
-        self.api_key = "test-api-key"
-        self.client = OneMeterApiClient(device_id=self.device_id, api_key=self.api_key)
+    device_id = "test-device-id"
+    api_key = "test-api-key"
+
+    @pytest.fixture(autouse=True)
+    def _client(self, fake_session):
+        """Create a client using the fake session."""
+        self.session = fake_session
+        self.client = OneMeterApiClient(
+            device_id=self.device_id, api_key=self.api_key, session=fake_session
+        )
 
     def test_initialization(self):
         """Test initialization of OneMeter API client."""
-        self.assertEqual(self.client.device_id, self.device_id)
-        self.assertEqual(self.client.api_key, self.api_key)
-        self.assertIsNotNone(self.client.base_url)
-        self.assertIsNotNone(self.client.headers)
-        self.assertEqual(self.client.headers["Authorization"], self.api_key)
-
-    @patch("custom_components.onemeter.api.requests.get")
-    def test_get_device_data(self, mock_get):
+        assert self.client.device_id == self.device_id
+        assert self.client.api_key == self.api_key
+        assert self.client._session is self.session
+
+    async def test_get_device_data(self):
         """Test getting device data."""
-        # Mock response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "lastReading": {
-                "OBIS": {
-                    "1_8_0": 12345.67,  # Energy Plus
-                    "16_7_0": 2.5,  # Power
-                    "S_1_1_2": 3.6,  # Battery voltage
-                }
-            },
-            "usage": {
-                "thisMonth": 123.45,
-                "previousMonth": 234.56,
-            }
-        }
-        mock_get.return_value = mock_response
+        self.session.respond((200, _DEVICE_DATA_JSON))
 
         # Call method
-        result = self.client.get_device_data()
+        result = await self.client.get_device_data()
 
         # Assertions
-        mock_get.assert_called_once_with(
-            f"{self.client.base_url}/devices/{self.device_id}",
-            headers=self.client.headers
+        self.session.get.assert_called_once_with(
+            f"{API_BASE_URL}devices/{self.device_id}",
+            headers={"Authorization": self.api_key},
+            params=None,
         )
-        self.assertEqual(result["lastReading"]["OBIS"]["1_8_0"], 12345.67)
-        self.assertEqual(result["usage"]["thisMonth"], 123.45)
+        assert result["lastReading"]["OBIS"]["1_8_0"] == 12345.67
+        assert result["usage"]["thisMonth"] == 123.45
 
-    @patch("custom_components.onemeter.api.requests.get")
-    def test_get_readings(self, mock_get):
+    async def test_get_readings(self):
         """Test getting readings data."""
-        # Mock response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "readings": [
-                {
-                    "1_8_0": 12345.67,
-                    "date": "2023-01-01T00:00:00.000Z"
-                }
-            ],
-            "meta": {
-                "OBIS": {
-                    "1_8_0": {
-                        "key": "POSITIVE_ACTIVE_ENERGY_TOTAL"
-                    }
-                }
-            }
-        }
-        mock_get.return_value = mock_response
+        self.session.respond((200, _READINGS_JSON))
 
         # Call method
-        result = self.client.get_readings(1, ["1_8_0"])
+        result = await self.client.get_readings(1, ["1_8_0"])
 
         # Assertions
-        self.assertEqual(result["readings"][0]["1_8_0"], 12345.67)
+        assert result["readings"][0]["1_8_0"] == 12345.67
 
-    def test_extract_device_value(self):
-        """Test extracting values from device data."""
-        device_data = {
-            "lastReading": {
-                "OBIS": {
-                    "1_8_0": 12345.67,
-                    "16_7_0": 2.5,
-                }
-            }
-        }
-
-        # Test existing values
-        self.assertEqual(self.client.extract_device_value(device_data, OBIS_ENERGY_PLUS), 12345.67)
-        self.assertEqual(self.client.extract_device_value(device_data, OBIS_POWER), 2.5)
+    async def test_api_error_handling(self):
+        """Test API error handling."""
+        self.session.respond((401, {"error": "Unauthorized"}))
 
-        # Test non-existent value
-        self.assertIsNone(self.client.extract_device_value(device_data, "non_existent"))
+        # Authentication errors are logged and yield no data
+        assert await self.client.get_device_data() == {}
 
-    def test_extract_reading_value(self):
-        """Test extracting values from readings data."""
-        readings_data = {
-            "readings": [
-                {
-                    "1_8_0": 12345.67,
-                    "date": "2023-01-01T00:00:00.000Z"
-                }
-            ]
+        # Test connection error
+        self.session.get.side_effect = Exception("Connection error")
+        with pytest.raises(Exception):
+            await self.client.get_device_data()
+
+
+@pytest.fixture(scope="session")
+def device_data():
+    """Device data with the OBIS values of the last reading."""
+    return {
+        "lastReading": {
+            "OBIS": {
+                "1_8_0": 12345.67,
+                "16_7_0": 2.5,
+            }
         }
+    }
 
-        # Test existing values
-        self.assertEqual(self.client.extract_reading_value(readings_data, OBIS_ENERGY_PLUS), 12345.67)
-
-        # Test non-existent value
-        self.assertIsNone(self.client.extract_reading_value(readings_data, "non_existent"))
 
-    def test_get_this_month_usage(self):
-        """Test getting this month's usage."""
-        device_data = {
-            "usage": {
-                "thisMonth": 123.45
+@pytest.fixture(scope="session")
+def readings_data():
+    """Readings data with the OBIS values as direct keys."""
+    return {
+        "readings": [
+            {
+                "1_8_0": 12345.67,
+                "date": "2023-01-01T00:00:00.000Z"
             }
-        }
+        ]
+    }
 
-        self.assertEqual(self.client.get_this_month_usage(device_data), 123.45)
-        self.assertIsNone(self.client.get_this_month_usage({}))
 
-    def test_get_previous_month_usage(self):
-        """Test getting previous month's usage."""
-        device_data = {
-            "usage": {
-                "previousMonth": 234.56
-            }
-        }
+@pytest.mark.parametrize(
+    ("obis_code", "expected"),
+    [(OBIS_ENERGY_PLUS, 12345.67), (OBIS_POWER, 2.5), ("non_existent", None)],
+)
+def test_extract_last_reading_value(device_data, obis_code, expected):
+    """Test extracting values from device data."""
+    assert _CLIENT.extract_device_value(device_data, obis_code) == expected
 
-        self.assertEqual(self.client.get_previous_month_usage(device_data), 234.56)
-        self.assertIsNone(self.client.get_previous_month_usage({}))
 
-    @patch("custom_components.onemeter.api.requests.get")
-    def test_api_error_handling(self, mock_get):
-        """Test API error handling."""
-        # Mock error response
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        mock_response.json.return_value = {"error": "Unauthorized"}
-        mock_get.return_value = mock_response
+@pytest.mark.parametrize(
+    ("obis_code", "expected"),
+    [(OBIS_ENERGY_PLUS, 12345.67), ("non_existent", None)],
+)
+def test_extract_direct_reading_value(readings_data, obis_code, expected):
+    """Test extracting values from readings data."""
+    assert _CLIENT.extract_reading_value(readings_data, obis_code) == expected
 
-        # Test that exception is raised
-        with self.assertRaises(Exception):
-            self.client.get_device_data()
 
-        # Test connection error
-        mock_get.side_effect = Exception("Connection error")
-        with self.assertRaises(Exception):
-            self.client.get_device_data()
+@pytest.fixture(scope="session")
+def api_client_template():
+    """API client the async tests copy before replacing api_call."""
+    return OneMeterApiClient(device_id="test123", api_key="api_key_test")
 
 
-async def test_api_client_get_device_data():
+async def test_api_client_get_device_data(api_client_template):
     """Test the get_device_data method."""
-    client = OneMeterApiClient(device_id="test123", api_key="api_key_test")
+    client = copy.copy(api_client_template)
 
     # Mock the api_call method
     client.api_call = AsyncMock(return_value={
@@ -185,9 +179,9 @@ async def test_api_client_get_device_data():
     client.api_call.assert_called_once_with(f"devices/{client.device_id}")
 
 
-async def test_api_client_get_readings():
+async def test_api_client_get_readings(api_client_template):
     """Test the get_readings method."""
-    client = OneMeterApiClient(device_id="test123", api_key="api_key_test")
+    client = copy.copy(api_client_template)
 
     # Mock the api_call method
     client.api_call = AsyncMock(return_value={
@@ -214,20 +208,21 @@ async def test_api_client_get_readings():
     # Verify the api_call was called with correct parameters
     client.api_call.assert_called_once_with(
         f"devices/{client.device_id}/readings",
-        {"count": 1, "codes": "1_8_0,16_7_0"}
+        {"obis": "1_8_0,16_7_0", "count": 1}
     )
 
 
-async def test_extract_device_value():
+async def test_extract_device_value(api_client_template):
     """Test the extract_device_value method."""
-    client = OneMeterApiClient(device_id="test123", api_key="api_key_test")
+    client = api_client_template
 
-    # Test valid data
+    # Test valid data, in the last reading shape the extractor parses
     data = {
-        "OBIS": {
-            "1_8_0": {"value": 1234.56},
-            "empty_value": {},
-            "null_value": {"value": None}
+        "lastReading": {
+            "OBIS": {
+                "1_8_0": 1234.56,
+                "null_value": None
+            }
         }
     }
 
@@ -237,13 +232,9 @@ async def test_extract_device_value():
     # Test missing OBIS code
     assert client.extract_device_value(data, "not_exists") is None
 
-    # Test empty value
-    assert client.extract_device_value(data, "empty_value") is None
-
     # Test null value
     assert client.extract_device_value(data, "null_value") is None
 
     # Test invalid data
-    assert client.extract_device_value(None, "1_8_0") is None
-    assert client.extract_device_value({}, "1_8_0") is None
-    assert client.extract_device_value({"OBIS": None}, "1_8_0") is None
+    for bad in (None, {}, {"OBIS": None}, {"lastReading": {"OBIS": None}}):
+        assert client.extract_device_value(bad, "1_8_0") is None
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import asyncio
 from http import HTTPStatus
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import aiohttp
 import pytest
@@ -23,157 +23,145 @@ from custom_components.onemeter.api import (
     RESP_PREV_MONTH,
 )
 
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-@pytest.fixture
+
+@pytest.fixture(scope="module", autouse=True)
+def _short_retries():
+    """Limit the API client to one retry so retry tests stay short."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr("custom_components.onemeter.api.API_RETRY_ATTEMPTS", 2)
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep():
+    """Skip the real backoff waits between API retries."""
+    with patch("custom_components.onemeter.api.asyncio.sleep", new=AsyncMock()) as mock:
+        yield mock
+
+
+@pytest.fixture(scope="module")
 def onemeter_client():
-    """Create a test instance of OneMeterApiClient."""
+    """Create a test instance of OneMeterApiClient shared by the module."""
     return OneMeterApiClient(device_id="test-device-id", api_key="test-api-key")
 
 
-@pytest.mark.asyncio
-async def test_client_initialization(onemeter_client):
+@pytest.fixture(autouse=True)
+def _fresh_session(onemeter_client):
+    """Drop the session the previous test left on the shared client."""
+    onemeter_client._session = None
+
+
+@pytest.fixture
+def session_client(fake_session):
+    """Create an OneMeterApiClient using the fake session."""
+    return OneMeterApiClient(
+        device_id="test-device-id", api_key="test-api-key", session=fake_session
+    )
+
+
+def test_client_initialization(onemeter_client):
     """Test OneMeter client initialization."""
     assert onemeter_client.device_id == "test-device-id"
     assert onemeter_client.api_key == "test-api-key"
     assert onemeter_client._session is None
 
 
-@pytest.mark.asyncio
-@patch("custom_components.onemeter.api.aiohttp.ClientSession")
-async def test_create_session(mock_client_session, onemeter_client):
+async def test_create_session(onemeter_client):
     """Test creating a client session."""
-    session_instance = MagicMock()
-    mock_client_session.return_value = session_instance
-
-    result = await onemeter_client._create_session()
+    session = await onemeter_client._create_session()
 
-    mock_client_session.assert_called_once()
-    assert result == session_instance
-    assert onemeter_client._session == session_instance
+    assert isinstance(session, aiohttp.ClientSession)
+    assert onemeter_client._session is session
 
     # Test reusing existing session
-    mock_client_session.reset_mock()
-    onemeter_client._session.closed = False
-    result = await onemeter_client._create_session()
+    assert await onemeter_client._create_session() is session
+
+    await onemeter_client.close()
+
+
+async def test_injected_session(fake_session, session_client):
+    """Test that a session passed in is used and left open on close."""
+    assert await session_client._create_session() is fake_session
 
-    mock_client_session.assert_not_called()
-    assert result == session_instance
+    fake_session.close = AsyncMock()
+    await session_client.close()
 
+    fake_session.close.assert_not_called()
+    assert session_client._session is None
 
-@pytest.mark.asyncio
-@patch("custom_components.onemeter.api.aiohttp.ClientSession")
-async def test_api_call_success(mock_client_session, onemeter_client):
+
+async def test_api_call_success(fake_session, session_client):
     """Test successful API call."""
     # Setup mock session and response
-    session_mock = MagicMock()
-    response_mock = AsyncMock()
-    response_mock.status = HTTPStatus.OK
-    response_mock.json.return_value = {"data": "test_data"}
-
-    # Setup context managers
-    session_mock.get.return_value.__aenter__.return_value = response_mock
-    mock_client_session.return_value = session_mock
+    fake_session.respond((HTTPStatus.OK, {"data": "test_data"}))
 
-    result = await onemeter_client.api_call("test-endpoint")
+    result = await session_client.api_call("test-endpoint")
 
     # Verify call was made correctly
-    session_mock.get.assert_called_once()
-    response_mock.json.assert_called_once()
+    assert fake_session.get.call_count == 1
     assert result == {"data": "test_data"}
 
 
-@pytest.mark.asyncio
-@patch("custom_components.onemeter.api.aiohttp.ClientSession")
-@patch("custom_components.onemeter.api.asyncio.sleep")
-async def test_api_call_retry(mock_sleep, mock_client_session, onemeter_client):
+async def test_api_call_retry(fake_session, session_client, _no_sleep):
     """Test API call retry mechanism."""
-    # Set up session and two responses: first fails, second succeeds
-    session_mock = MagicMock()
-    failed_response = AsyncMock()
-    failed_response.status = HTTPStatus.INTERNAL_SERVER_ERROR
-    failed_response.text.return_value = "Server error"
-
-    success_response = AsyncMock()
-    success_response.status = HTTPStatus.OK
-    success_response.json.return_value = {"data": "retry_success"}
-
     # First call returns failure, second returns success
-    session_mock.get.return_value.__aenter__.side_effect = [
-        failed_response, success_response
-    ]
+    fake_session.respond(
+        (HTTPStatus.INTERNAL_SERVER_ERROR, "Server error"),
+        (HTTPStatus.OK, {"data": "retry_success"}),
+    )
 
-    mock_client_session.return_value = session_mock
-
-    result = await onemeter_client.api_call("test-endpoint")
+    result = await session_client.api_call("test-endpoint")
 
     # Verify retry happened
-    assert session_mock.get.call_count == 2
-    mock_sleep.assert_called_once()
+    assert fake_session.get.call_count == 2
+    _no_sleep.assert_called_once()
     assert result == {"data": "retry_success"}
 
 
-@pytest.mark.asyncio
-@patch("custom_components.onemeter.api.aiohttp.ClientSession")
-async def test_api_call_auth_error(mock_client_session, onemeter_client):
+async def test_api_call_auth_error(fake_session, session_client):
     """Test API call with authentication error."""
     # Setup mock session and error response
-    session_mock = MagicMock()
-    response_mock = AsyncMock()
-    response_mock.status = HTTPStatus.UNAUTHORIZED
-    response_mock.text.return_value = "Unauthorized"
-
-    session_mock.get.return_value.__aenter__.return_value = response_mock
-    mock_client_session.return_value = session_mock
+    fake_session.respond((HTTPStatus.UNAUTHORIZED, "Unauthorized"))
 
-    result = await onemeter_client.api_call("test-endpoint")
+    result = await session_client.api_call("test-endpoint")
 
     # Verify no retry attempted for auth errors
-    session_mock.get.assert_called_once()
+    assert fake_session.get.call_count == 1
     assert result == {}
 
 
-@pytest.mark.asyncio
-@patch("custom_components.onemeter.api.aiohttp.ClientSession")
-async def test_api_call_rate_limit(mock_client_session, onemeter_client):
+async def test_api_call_rate_limit(fake_session, session_client):
     """Test API call with rate limit error."""
     # Setup mock session and rate limit response
-    session_mock = MagicMock()
-    response_mock = AsyncMock()
-    response_mock.status = HTTPStatus.TOO_MANY_REQUESTS
-    response_mock.text.return_value = "Rate limited"
+    fake_session.respond((HTTPStatus.TOO_MANY_REQUESTS, "Rate limited"))
 
-    session_mock.get.return_value.__aenter__.return_value = response_mock
-    mock_client_session.return_value = session_mock
-
-    result = await onemeter_client.api_call("test-endpoint")
+    result = await session_client.api_call("test-endpoint")
 
     # Verify no retry attempted for rate limit errors
-    session_mock.get.assert_called_once()
+    assert fake_session.get.call_count == 1
     assert result == {}
 
 
-@pytest.mark.asyncio
-@patch("custom_components.onemeter.api.aiohttp.ClientSession")
-@patch("custom_components.onemeter.api.asyncio.sleep")
-async def test_api_call_timeout(mock_sleep, mock_client_session, onemeter_client):
+async def test_api_call_timeout(fake_session, session_client, _no_sleep):
     """Test API call with timeout error."""
     # Setup mock session to raise timeout
-    session_mock = MagicMock()
-    session_mock.get.return_value.__aenter__.side_effect = asyncio.TimeoutError
-    mock_client_session.return_value = session_mock
+    fake_session.respond(asyncio.TimeoutError())
 
-    await onemeter_client.api_call("test-endpoint")
+    await session_client.api_call("test-endpoint")
 
     # Verify retry was attempted
-    assert session_mock.get.call_count > 1
-    mock_sleep.assert_called()
+    assert fake_session.get.call_count == 2
+    _no_sleep.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_get_all_devices(onemeter_client):
+async def test_get_all_devices(onemeter_client, monkeypatch):
     """Test getting all devices."""
     # Replace api_call method with a mock
-    onemeter_client.api_call = AsyncMock(return_value={"devices": [{"id": "device1"}]})
+    monkeypatch.setattr(
+        onemeter_client, "api_call", AsyncMock(return_value={"devices": [{"id": "device1"}]})
+    )
 
     result = await onemeter_client.get_all_devices()
 
@@ -181,11 +169,12 @@ async def test_get_all_devices(onemeter_client):
     assert result == {"devices": [{"id": "device1"}]}
 
 
-@pytest.mark.asyncio
-async def test_get_device_data(onemeter_client):
+async def test_get_device_data(onemeter_client, monkeypatch):
     """Test getting device data."""
     # Replace api_call method with a mock
-    onemeter_client.api_call = AsyncMock(return_value={"id": "test-device-id"})
+    monkeypatch.setattr(
+        onemeter_client, "api_call", AsyncMock(return_value={"id": "test-device-id"})
+    )
 
     result = await onemeter_client.get_device_data()
 
@@ -193,11 +182,12 @@ async def test_get_device_data(onemeter_client):
     assert result == {"id": "test-device-id"}
 
 
-@pytest.mark.asyncio
-async def test_get_readings(onemeter_client):
+async def test_get_readings(onemeter_client, monkeypatch):
     """Test getting readings data."""
     # Replace api_call method with a mock
-    onemeter_client.api_call = AsyncMock(return_value={"readings": []})
+    monkeypatch.setattr(
+        onemeter_client, "api_call", AsyncMock(return_value={"readings": []})
+    )
 
     # Test with default parameters
     await onemeter_client.get_readings()
@@ -215,147 +205,139 @@ async def test_get_readings(onemeter_client):
     assert call_args[0][1]["count"] == 5
 
 
-def test_extract_device_value(onemeter_client):
-    """Test extracting values from device data."""
-    # Test with valid data
+# Extractor, input data, OBIS code (None for the usage getters), expected value
+EXTRACTOR_CASES = [
+    # Device values from the last reading
+    (
+        "extract_device_value",
+        {RESP_LAST_READING: {RESP_OBIS: {"1_8_0": 12345.67, "16_7_0": 2.5}}},
+        "1_8_0",
+        12345.67,
+    ),
+    (
+        "extract_device_value",
+        {RESP_LAST_READING: {RESP_OBIS: {"1_8_0": 12345.67, "16_7_0": 2.5}}},
+        "16_7_0",
+        2.5,
+    ),
+    (
+        "extract_device_value",
+        {RESP_LAST_READING: {RESP_OBIS: {"1_8_0": 12345.67, "16_7_0": 2.5}}},
+        "non_existent",
+        None,
+    ),
+    (
+        "extract_device_value",
+        {RESP_DEVICES: [{RESP_LAST_READING: {RESP_OBIS: {"1_8_0": 9999.99}}}]},
+        "1_8_0",
+        9999.99,
+    ),
+    # Reading values, nested under OBIS or as direct keys
+    (
+        "extract_reading_value",
+        {"readings": [{RESP_OBIS: {"1_8_0": 12345.67, "16_7_0": 2.5}}]},
+        "1_8_0",
+        12345.67,
+    ),
+    (
+        "extract_reading_value",
+        {"readings": [{RESP_OBIS: {"1_8_0": 12345.67, "16_7_0": 2.5}}]},
+        "16_7_0",
+        2.5,
+    ),
+    (
+        "extract_reading_value",
+        {"readings": [{RESP_OBIS: {"1_8_0": 12345.67, "16_7_0": 2.5}}]},
+        "non_existent",
+        None,
+    ),
+    (
+        "extract_reading_value",
+        {"readings": [{"1_8_0": 9876.54, "date": "2025-04-13T12:00:00.000Z"}]},
+        "1_8_0",
+        9876.54,
+    ),
+    # Monthly usage
+    ("get_this_month_usage", {RESP_USAGE: {RESP_THIS_MONTH: 123.45}}, None, 123.45),
+    (
+        "get_this_month_usage",
+        {RESP_DEVICES: [{RESP_USAGE: {RESP_THIS_MONTH: 678.90}}]},
+        None,
+        678.90,
+    ),
+    ("get_previous_month_usage", {RESP_USAGE: {RESP_PREV_MONTH: 234.56}}, None, 234.56),
+    (
+        "get_previous_month_usage",
+        {RESP_DEVICES: [{RESP_USAGE: {RESP_PREV_MONTH: 789.01}}]},
+        None,
+        789.01,
+    ),
+]
+
+
+@pytest.mark.parametrize(("extractor", "data", "obis_code", "expected"), EXTRACTOR_CASES)
+def test_extractors(onemeter_client, extractor, data, obis_code, expected):
+    """Test extracting values and monthly usage from API data."""
+    method = getattr(onemeter_client, extractor)
+    args = (data,) if obis_code is None else (data, obis_code)
+    assert method(*args) == expected
+
+
+def test_extractors_invalid_data(onemeter_client):
+    """Test extractors return None for empty or malformed data."""
+    for bad in ({}, None, "invalid"):
+        assert onemeter_client.extract_device_value(bad, "1_8_0") is None
+        assert onemeter_client.extract_reading_value(bad, "1_8_0") is None
+
+    for bad in ({}, None, {RESP_USAGE: {}}):
+        assert onemeter_client.get_this_month_usage(bad) is None
+        assert onemeter_client.get_previous_month_usage(bad) is None
+
+
+def test_get_obis_values(onemeter_client):
+    """Test flattening device and readings values."""
     device_data = {
         RESP_LAST_READING: {
             RESP_OBIS: {
                 "1_8_0": 12345.67,
-                "16_7_0": 2.5,
+                "2_8_0": None,
             }
         }
     }
-
-    assert onemeter_client.extract_device_value(device_data, "1_8_0") == 12345.67
-    assert onemeter_client.extract_device_value(device_data, "16_7_0") == 2.5
-    assert onemeter_client.extract_device_value(device_data, "non_existent") is None
-
-    # Test with nested device structure
-    nested_data = {
-        RESP_DEVICES: [{
-            RESP_LAST_READING: {
-                RESP_OBIS: {
-                    "1_8_0": 9999.99
-                }
-            }
-        }]
-    }
-
-    assert onemeter_client.extract_device_value(nested_data, "1_8_0") == 9999.99
-
-    # Test with empty/invalid data
-    assert onemeter_client.extract_device_value({}, "1_8_0") is None
-    assert onemeter_client.extract_device_value(None, "1_8_0") is None
-    assert onemeter_client.extract_device_value("invalid", "1_8_0") is None
-
-
-def test_extract_reading_value(onemeter_client):
-    """Test extracting values from readings data."""
-    # Test with valid data
     readings_data = {
         "readings": [{
             RESP_OBIS: {
-                "1_8_0": 12345.67,
+                "1_8_0": 1.0,
+                "2_8_0": 0.5,
                 "16_7_0": 2.5,
-            },
-            "date": "2025-04-13T12:00:00.000Z"
-        }]
-    }
-
-    assert onemeter_client.extract_reading_value(readings_data, "1_8_0") == 12345.67
-    assert onemeter_client.extract_reading_value(readings_data, "16_7_0") == 2.5
-    assert onemeter_client.extract_reading_value(readings_data, "non_existent") is None
-
-    # Test with direct keys in reading
-    direct_readings_data = {
-        "readings": [{
-            "1_8_0": 9876.54,
-            "date": "2025-04-13T12:00:00.000Z"
-        }]
-    }
-
-    assert onemeter_client.extract_reading_value(direct_readings_data, "1_8_0") == 9876.54
-
-    # Test with empty/invalid data
-    assert onemeter_client.extract_reading_value({}, "1_8_0") is None
-    assert onemeter_client.extract_reading_value(None, "1_8_0") is None
-    assert onemeter_client.extract_reading_value("invalid", "1_8_0") is None
-
-
-def test_get_this_month_usage(onemeter_client):
-    """Test getting this month's usage."""
-    # Test with valid data
-    device_data = {
-        RESP_USAGE: {
-            RESP_THIS_MONTH: 123.45
-        }
-    }
-
-    assert onemeter_client.get_this_month_usage(device_data) == 123.45
-
-    # Test with nested device structure
-    nested_data = {
-        RESP_DEVICES: [{
-            RESP_USAGE: {
-                RESP_THIS_MONTH: 678.90
             }
         }]
     }
 
-    assert onemeter_client.get_this_month_usage(nested_data) == 678.90
-
-    # Test with empty/invalid data
-    assert onemeter_client.get_this_month_usage({}) is None
-    assert onemeter_client.get_this_month_usage(None) is None
-    assert onemeter_client.get_this_month_usage({RESP_USAGE: {}}) is None
-
-
-def test_get_previous_month_usage(onemeter_client):
-    """Test getting previous month's usage."""
-    # Test with valid data
-    device_data = {
-        RESP_USAGE: {
-            RESP_PREV_MONTH: 234.56
-        }
-    }
-
-    assert onemeter_client.get_previous_month_usage(device_data) == 234.56
-
-    # Test with nested device structure
-    nested_data = {
-        RESP_DEVICES: [{
-            RESP_USAGE: {
-                RESP_PREV_MONTH: 789.01
-            }
-        }]
+    # Device data wins, readings data fills in the gaps
+    assert onemeter_client.get_obis_values(device_data, readings_data) == {
+        "1_8_0": 12345.67,
+        "2_8_0": 0.5,
+        "16_7_0": 2.5,
     }
 
-    assert onemeter_client.get_previous_month_usage(nested_data) == 789.01
+    # Test with missing readings data
+    assert onemeter_client.get_obis_values(device_data, None) == {"1_8_0": 12345.67}
 
     # Test with empty/invalid data
-    assert onemeter_client.get_previous_month_usage({}) is None
-    assert onemeter_client.get_previous_month_usage(None) is None
-    assert onemeter_client.get_previous_month_usage({RESP_USAGE: {}}) is None
+    assert onemeter_client.get_obis_values({}, None) == {}
 
 
-@pytest.mark.asyncio
-@patch("custom_components.onemeter.api.aiohttp.ClientSession")
-async def test_close_session(mock_client_session, onemeter_client):
+async def test_close_session(onemeter_client):
     """Test closing the API client session."""
-    # Create a mock session
-    mock_session = AsyncMock()
-    mock_client_session.return_value = mock_session
-
     # Create a session then close it
-    await onemeter_client._create_session()
+    session = await onemeter_client._create_session()
     await onemeter_client.close()
 
     # Verify session was closed
-    mock_session.close.assert_called_once()
+    assert session.closed
     assert onemeter_client._session is None
 
     # Test closing when no session exists
-    mock_session.reset_mock()
     await onemeter_client.close()
-    mock_session.close.assert_not_called()
+    assert onemeter_client._session is None
@@ -17,6 +17,16 @@ from custom_components.onemeter.const import (
 )
 
 
+def _user_flow(hass: HomeAssistant) -> OneMeterConfigFlow:
+    """Build a config flow bound to hass as if the user had started it."""
+    flow = OneMeterConfigFlow()
+    flow.hass = hass
+    flow.handler = DOMAIN
+    flow.context = {"source": config_entries.SOURCE_USER}
+    return flow
+
+
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_config_flow_user_step(hass: HomeAssistant, mock_get_available_devices):
     """Test the user step of the config flow."""
@@ -26,28 +36,23 @@ async def test_config_flow_user_step(hass: HomeAssistant, mock_get_available_dev
     ]
 
     # Initialize config flow
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": config_entries.SOURCE_USER}
-    )
+    flow = _user_flow(hass)
+    result = await flow.async_step_user()
 
     # Check that the user form is shown
     assert result["type"] == FlowResultType.FORM
     assert result["step_id"] == "user"
-    assert "flow_id" in result
 
     # Complete the user step with API key
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"], user_input={CONF_API_KEY: "api_key_test"}
-    )
+    result = await flow.async_step_user({CONF_API_KEY: "api_key_test"})
 
     # Check that we moved to device selection step
     assert result["type"] == FlowResultType.FORM
     assert result["step_id"] == "device"
 
     # Complete the device step
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"],
-        user_input={CONF_DEVICE_ID: "device123", CONF_NAME: "Custom Device Name"}
+    result = await flow.async_step_device(
+        {CONF_DEVICE_ID: "device123", CONF_NAME: "Custom Device Name"}
     )
 
     # Check that config entry was created
@@ -63,6 +68,7 @@ async def test_config_flow_user_step(hass: HomeAssistant, mock_get_available_dev
     }
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_config_flow_no_devices(hass: HomeAssistant, mock_get_available_devices):
     """Test the config flow when no devices are available."""
@@ -70,14 +76,10 @@ async def test_config_flow_no_devices(hass: HomeAssistant, mock_get_available_de
     mock_get_available_devices.return_value = []
 
     # Initialize config flow
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": config_entries.SOURCE_USER}
-    )
+    flow = _user_flow(hass)
 
     # Complete the user step with API key
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"], user_input={CONF_API_KEY: "api_key_test"}
-    )
+    result = await flow.async_step_user({CONF_API_KEY: "api_key_test"})
 
     # Check that we show error
     assert result["type"] == FlowResultType.FORM
@@ -85,6 +87,7 @@ async def test_config_flow_no_devices(hass: HomeAssistant, mock_get_available_de
     assert result["errors"]["base"] == "no_devices"
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_config_flow_already_configured(hass: HomeAssistant, mock_get_available_devices):
     """Test that a device cannot be configured twice."""
@@ -108,20 +111,15 @@ async def test_config_flow_already_configured(hass: HomeAssistant, mock_get_avai
     hass.config_entries.async_entries = lambda domain: [entry] if domain == DOMAIN else []
 
     # Initialize config flow
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": config_entries.SOURCE_USER}
-    )
+    flow = _user_flow(hass)
 
     # Complete the user step with API key
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"], user_input={CONF_API_KEY: "api_key_test"}
-    )
+    result = await flow.async_step_user({CONF_API_KEY: "api_key_test"})
 
     # Should show device selection but with abort
     with patch.object(OneMeterConfigFlow, 'async_set_unique_id') as mock_set_id:
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            user_input={CONF_DEVICE_ID: "device123", CONF_NAME: "Custom Device Name"}
+        result = await flow.async_step_device(
+            {CONF_DEVICE_ID: "device123", CONF_NAME: "Custom Device Name"}
         )
 
     # Config should abort since device is already configured
@@ -130,6 +128,7 @@ async def test_config_flow_already_configured(hass: HomeAssistant, mock_get_avai
     assert result["reason"] == "already_configured"
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_config_flow_api_error(hass: HomeAssistant, mock_get_available_devices):
     """Test the config flow when API errors occur."""
@@ -137,14 +136,10 @@ async def test_config_flow_api_error(hass: HomeAssistant, mock_get_available_dev
     mock_get_available_devices.side_effect = Exception("API Error")
 
     # Initialize config flow
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": config_entries.SOURCE_USER}
-    )
+    flow = _user_flow(hass)
 
     # Complete the user step with API key
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"], user_input={CONF_API_KEY: "api_key_test"}
-    )
+    result = await flow.async_step_user({CONF_API_KEY: "api_key_test"})
 
     # Check that we show error
     assert result["type"] == FlowResultType.FORM
@@ -3,23 +3,78 @@ from __future__ import annotations
 
 import asyncio
 from datetime import timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import UpdateFailed
 from homeassistant.util import dt as dt_util
 
-from custom_components.onemeter.api import OneMeterApiClient
 from custom_components.onemeter.coordinator import (
+    OneMeterSlowCoordinator,
     OneMeterUpdateCoordinator,
     _validate_api_data
 )
-from custom_components.onemeter.const import SENSOR_TO_OBIS_MAP, UPDATE_OFFSET_SECONDS, DEFAULT_REFRESH_INTERVAL
+from custom_components.onemeter.const import (
+    DEFAULT_REFRESH_INTERVAL,
+    FAST_SENSOR_TO_OBIS_MAP,
+    SENSOR_TO_OBIS_MAP,
+    SLOW_REFRESH_INTERVAL,
+    SLOW_RETRY_INTERVAL,
+    SLOW_SENSOR_TO_OBIS_MAP,
+    UPDATE_OFFSET_SECONDS,
+)
 
+# Clock readings for the update interval scenarios, parsed once
+FAKE_NOW_NEAR = dt_util.parse_datetime("2025-04-13 12:17:10+00:00")
+FAKE_NOW_EXACT = dt_util.parse_datetime("2025-04-13 12:15:00+00:00")
+FAKE_NOW_CLOSE = dt_util.parse_datetime("2025-04-13 12:20:28+00:00")
+FAKE_NOW_AHEAD = dt_util.parse_datetime("2025-04-13 12:22:30+00:00")
 
-@pytest.mark.asyncio
-async def test_validate_api_data_success():
+
+class _StubClient:
+    """Minimal API client serving canned data to the coordinator."""
+
+    device_id = "test-device-id"
+
+    def __init__(
+        self,
+        device_data=None,
+        readings=None,
+        obis_values=None,
+        this_month=None,
+        previous_month=None,
+        raise_on=None,
+    ):
+        self._device_data = device_data or {}
+        self._readings = readings or {}
+        self._obis_values = obis_values or {}
+        self._this_month = this_month
+        self._previous_month = previous_month
+        self._raise_on = raise_on or {}
+
+    async def get_device_data(self):
+        if err := self._raise_on.get("get_device_data"):
+            raise err
+        return self._device_data
+
+    async def get_readings(self, count=1, obis_codes=None):
+        if err := self._raise_on.get("get_readings"):
+            raise err
+        return self._readings
+
+    def get_obis_values(self, device_data, readings_data):
+        return self._obis_values
+
+    def get_this_month_usage(self, device_data):
+        return self._this_month
+
+    def get_previous_month_usage(self, device_data):
+        return self._previous_month
+
+
+def test_validate_api_data_success():
     """Test successful API data validation."""
     device_data = {"lastReading": {"OBIS": {}}}
     readings_data = {"readings": []}
@@ -28,15 +83,13 @@ async def test_validate_api_data_success():
     _validate_api_data(device_data, readings_data)
 
 
-@pytest.mark.asyncio
-async def test_validate_api_data_missing_both():
+def test_validate_api_data_missing_both():
     """Test API data validation when both data sources are missing."""
     with pytest.raises(UpdateFailed):
         _validate_api_data(None, None)
 
 
-@pytest.mark.asyncio
-async def test_validate_api_data_invalid_format():
+def test_validate_api_data_invalid_format():
     """Test API data validation with invalid data format."""
     # Invalid device data format
     with pytest.raises(UpdateFailed):
@@ -51,14 +104,14 @@ async def test_validate_api_data_invalid_format():
     _validate_api_data(None, {})
 
 
-@pytest.mark.asyncio
-async def test_coordinator_init(hass: HomeAssistant):
+@pytest.mark.xdist_group("hass_session")
+@pytest.mark.asyncio(loop_scope="session")
+async def test_coordinator_init(session_hass: HomeAssistant):
     """Test coordinator initialization."""
-    client = AsyncMock(spec=OneMeterApiClient)
-    client.device_id = "test-device-id"
+    client = _StubClient()
 
     coordinator = OneMeterUpdateCoordinator(
-        hass=hass,
+        hass=session_hass,
         client=client,
         refresh_interval=15,
         name="Test OneMeter",
@@ -71,52 +124,63 @@ async def test_coordinator_init(hass: HomeAssistant):
     assert coordinator.name == "Test OneMeter"
 
 
-@pytest.mark.asyncio
-async def test_calculate_update_interval(hass: HomeAssistant):
+@pytest.mark.xdist_group("hass_session")
+@pytest.mark.asyncio(loop_scope="session")
+async def test_calculate_update_interval(
+    session_hass: HomeAssistant, freezer: FrozenDateTimeFactory
+):
     """Test calculating update interval."""
-    client = AsyncMock(spec=OneMeterApiClient)
-    client.device_id = "test-device-id"
+    client = _StubClient()
 
     # Test with 5 minute interval
     coordinator = OneMeterUpdateCoordinator(
-        hass=hass,
+        hass=session_hass,
         client=client,
         refresh_interval=5,
         name="Test OneMeter",
         device_id="test-device-id"
     )
 
-    # Mock current time to control the calculation
-    with patch('homeassistant.util.dt.now') as mock_now:
-        # Test when we're at minute 17 (3 minutes before next 5-min mark)
-        fake_now = dt_util.parse_datetime("2025-04-13 12:17:10")
-        mock_now.return_value = fake_now
+    # Test when we're at minute 17 (3 minutes before next 5-min mark)
+    freezer.move_to(FAKE_NOW_NEAR)
+
+    interval = coordinator._calculate_update_interval()
+
+    # Expected seconds to sync: (20-17)*60 - 10 + UPDATE_OFFSET_SECONDS
+    expected_seconds = 3 * 60 - 10 + UPDATE_OFFSET_SECONDS
+    assert interval == timedelta(seconds=expected_seconds)
+
+    # Test when we're at exact interval
+    freezer.move_to(FAKE_NOW_EXACT)
 
-        interval = coordinator._calculate_update_interval()
+    interval = coordinator._calculate_update_interval()
 
-        # Expected seconds to sync: (20-17)*60 - 10 + UPDATE_OFFSET_SECONDS
-        expected_seconds = 3 * 60 - 10 + UPDATE_OFFSET_SECONDS
-        assert interval == timedelta(seconds=expected_seconds)
+    # Expected seconds to sync: (0)*60 - 0 + UPDATE_OFFSET_SECONDS
+    expected_seconds = UPDATE_OFFSET_SECONDS
+    assert interval == timedelta(seconds=expected_seconds)
 
-        # Test when we're at exact interval
-        fake_now = dt_util.parse_datetime("2025-04-13 12:15:00")
-        mock_now.return_value = fake_now
+    # Test when we're too close to next update (2 seconds before 12:20:30)
+    freezer.move_to(FAKE_NOW_CLOSE)
 
-        interval = coordinator._calculate_update_interval()
+    interval = coordinator._calculate_update_interval()
 
-        # Expected seconds to sync: (0)*60 - 0 + UPDATE_OFFSET_SECONDS
-        expected_seconds = UPDATE_OFFSET_SECONDS
-        assert interval == timedelta(seconds=expected_seconds)
+    # Should add a full interval since it's less than 5 seconds away
+    # Expected seconds to sync: 5*60 (seconds) + a small amount of seconds
+    assert interval == timedelta(seconds=5 * 60 + 2)
 
-        # Test when we're too close to next update
-        fake_now = dt_util.parse_datetime("2025-04-13 12:19:58")
-        mock_now.return_value = fake_now
+    # Test that the scheduled tick is reused while it is still ahead
+    freezer.move_to(FAKE_NOW_AHEAD)
 
-        interval = coordinator._calculate_update_interval()
+    interval = coordinator._calculate_update_interval()
 
-        # Should add a full interval since it's less than 5 seconds away
-        # Expected seconds to sync: 5*60 (seconds) + a small amount of seconds
-        assert interval.total_seconds() > 5 * 60
+    assert interval == timedelta(seconds=3 * 60)
+
+    # Test that a cached tick wins over a fresh computation (which gives 180s)
+    coordinator._next_tick = int(FAKE_NOW_AHEAD.timestamp()) + 2 * 60
+
+    interval = coordinator._calculate_update_interval()
+
+    assert interval == timedelta(seconds=2 * 60)
 
 
 @pytest.mark.asyncio
@@ -157,20 +221,19 @@ async def test_async_update_data(hass: HomeAssistant, mock_api_client):
 async def test_async_update_data_partial_failure(hass: HomeAssistant):
     """Test data update when one API call fails but the other succeeds."""
     # Create a client with device_data success but readings failure
-    client = AsyncMock(spec=OneMeterApiClient)
-    client.device_id = "test-device-id"
-    client.get_device_data = AsyncMock(return_value={
-        "lastReading": {
-            "OBIS": {
-                "1_8_0": 12345.67,  # Energy Plus
+    client = _StubClient(
+        device_data={
+            "lastReading": {
+                "OBIS": {
+                    "1_8_0": 12345.67,  # Energy Plus
+                }
             }
-        }
-    })
-    client.get_readings = AsyncMock(side_effect=Exception("API error"))
-    client.extract_device_value = MagicMock(return_value=12345.67)
-    client.extract_reading_value = MagicMock(return_value=None)
-    client.get_this_month_usage = MagicMock(return_value=123.45)
-    client.get_previous_month_usage = MagicMock(return_value=234.56)
+        },
+        obis_values={"1_8_0": 12345.67},
+        this_month=123.45,
+        previous_month=234.56,
+        raise_on={"get_readings": Exception("API error")},
+    )
 
     coordinator = OneMeterUpdateCoordinator(
         hass=hass,
@@ -196,10 +259,12 @@ async def test_async_update_data_partial_failure(hass: HomeAssistant):
 async def test_async_update_data_both_fail(hass: HomeAssistant):
     """Test data update when both API calls fail."""
     # Create a client where both API calls fail
-    client = AsyncMock(spec=OneMeterApiClient)
-    client.device_id = "test-device-id"
-    client.get_device_data = AsyncMock(side_effect=Exception("API error"))
-    client.get_readings = AsyncMock(side_effect=Exception("API error"))
+    client = _StubClient(
+        raise_on={
+            "get_device_data": Exception("API error"),
+            "get_readings": Exception("API error"),
+        },
+    )
 
     coordinator = OneMeterUpdateCoordinator(
         hass=hass,
@@ -215,17 +280,56 @@ async def test_async_update_data_both_fail(hass: HomeAssistant):
 
 
 @pytest.mark.asyncio
-async def test_coordinator_update(hass: HomeAssistant, mock_onemeter_client):
-    """Test coordinator update."""
-    # Create coordinator
+async def test_async_update_data_timeout(hass: HomeAssistant, mock_api_client):
+    """Test data update when the API does not answer in time."""
+    async def _hang():
+        await asyncio.sleep(1)
+
+    mock_api_client.get_device_data.side_effect = _hang
+
     coordinator = OneMeterUpdateCoordinator(
         hass=hass,
-        client=mock_onemeter_client,
+        client=mock_api_client,
+        refresh_interval=DEFAULT_REFRESH_INTERVAL,
+        name="Test Device",
+        device_id="device123456",
+    )
+
+    # Perform the update with a short timeout - expect it to fail
+    with patch(
+        "custom_components.onemeter.coordinator.UPDATE_TIMEOUT", 0.01
+    ), pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+
+
+@pytest.fixture(scope="module")
+def _coordinator_template(session_hass: HomeAssistant):
+    """Coordinator built once for the refresh tests of this module."""
+    return OneMeterUpdateCoordinator(
+        hass=session_hass,
+        client=None,
         refresh_interval=DEFAULT_REFRESH_INTERVAL,
         name="Test Device",
         device_id="device123456",
     )
 
+
+@pytest.fixture
+def coordinator(_coordinator_template, mock_api_client):
+    """Shared coordinator on the mocked client, reset to its initial state."""
+    coordinator = _coordinator_template
+    coordinator.client = mock_api_client
+    coordinator.data = None
+    coordinator.last_update_success = True
+    coordinator._previous = {}
+    coordinator.changed_keys = frozenset()
+    return coordinator
+
+
+@pytest.mark.xdist_group("hass_session")
+@pytest.mark.asyncio(loop_scope="session")
+async def test_coordinator_update(coordinator):
+    """Test coordinator update."""
     # Test initial refresh
     await coordinator.async_refresh()
 
@@ -242,23 +346,155 @@ async def test_coordinator_update(hass: HomeAssistant, mock_onemeter_client):
     assert coordinator.update_interval is not None
 
 
-@pytest.mark.asyncio
-async def test_coordinator_error_handling(hass: HomeAssistant, mock_onemeter_client):
+@pytest.mark.xdist_group("hass_session")
+@pytest.mark.asyncio(loop_scope="session")
+async def test_coordinator_error_handling(coordinator, mock_api_client):
     """Test coordinator error handling."""
-    # Create coordinator
+    # Make client.get_device_data raise an exception
+    mock_api_client.get_device_data.side_effect = Exception("API error")
+
+    # Refresh should handle the exception
+    await coordinator.async_refresh()
+
+    # Check that the coordinator properly handled the exception
+    assert coordinator.last_update_success is False
+
+
+@pytest.mark.asyncio
+async def test_coordinators_split_obis_codes(hass: HomeAssistant, mock_api_client):
+    """Test that fast and slow coordinators request their own OBIS codes."""
+    coordinator = OneMeterUpdateCoordinator(
+        hass=hass,
+        client=mock_api_client,
+        refresh_interval=DEFAULT_REFRESH_INTERVAL,
+        name="Test Device",
+        device_id="device123456",
+    )
+    slow_coordinator = OneMeterSlowCoordinator(
+        hass=hass,
+        client=mock_api_client,
+        refresh_interval=SLOW_REFRESH_INTERVAL,
+        name="Test Device",
+        device_id="device123456",
+    )
+
+    await coordinator.async_refresh()
+    fast_codes = mock_api_client.get_readings.call_args[0][1]
+
+    mock_api_client.get_readings.reset_mock()
+    await slow_coordinator.async_refresh()
+    slow_codes = mock_api_client.get_readings.call_args[0][1]
+
+    assert set(fast_codes) == set(FAST_SENSOR_TO_OBIS_MAP.values())
+    assert set(slow_codes) == set(SLOW_SENSOR_TO_OBIS_MAP.values())
+    assert set(fast_codes) | set(slow_codes) == set(SENSOR_TO_OBIS_MAP.values())
+
+    # Fast values only reach the fast coordinator's data
+    assert "energy_plus" in coordinator.data
+    assert "energy_plus" not in slow_coordinator.data
+
+
+@pytest.mark.asyncio
+async def test_slow_coordinator_retries_failed_refresh(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+):
+    """Test that a failed slow refresh is retried well before the next day."""
+    freezer.move_to(FAKE_NOW_NEAR)
+    client = _StubClient(
+        device_data={"lastReading": {"OBIS": {}}},
+        raise_on={"get_device_data": Exception("API error")},
+    )
+
+    slow_coordinator = OneMeterSlowCoordinator(
+        hass=hass,
+        client=client,
+        refresh_interval=SLOW_REFRESH_INTERVAL,
+        name="Test Device",
+        device_id="device123456",
+    )
+
+    # A failed refresh is retried after the short retry interval
+    await slow_coordinator.async_refresh()
+    assert slow_coordinator.last_update_success is False
+    assert slow_coordinator.update_interval == timedelta(minutes=SLOW_RETRY_INTERVAL)
+
+    # The next successful refresh returns to the daily tick at 00:07:45
+    client._raise_on = {}
+    await slow_coordinator.async_refresh()
+    assert slow_coordinator.last_update_success is True
+    assert slow_coordinator.update_interval == timedelta(
+        hours=11, minutes=50, seconds=35
+    )
+
+
+@pytest.mark.asyncio
+async def test_coordinators_split_derived_values(hass: HomeAssistant):
+    """Test that each coordinator only derives the values it exposes."""
+    client = _StubClient(
+        device_data={"lastReading": {"OBIS": {}}},
+        obis_values={
+            "1_8_0": 12345.67,  # Energy plus
+            "S_1_1_2": 3.6,  # Battery voltage
+            "C_1_0": "11722779",  # Meter serial
+            "S_1_1_8": "3/300",  # UART parameters
+            "S_1_2_0": "1.2.3",  # Firmware version
+        },
+        this_month=123.45,
+    )
     coordinator = OneMeterUpdateCoordinator(
         hass=hass,
-        client=mock_onemeter_client,
+        client=client,
         refresh_interval=DEFAULT_REFRESH_INTERVAL,
         name="Test Device",
         device_id="device123456",
     )
+    slow_coordinator = OneMeterSlowCoordinator(
+        hass=hass,
+        client=client,
+        refresh_interval=SLOW_REFRESH_INTERVAL,
+        name="Test Device",
+        device_id="device123456",
+    )
 
-    # Make client.get_device_data raise an exception
-    mock_onemeter_client.get_device_data.side_effect = Exception("API error")
+    fast_data = await coordinator._async_update_data()
+    slow_data = await slow_coordinator._async_update_data()
 
-    # Refresh should handle the exception
+    # Readings and their derived values stay with the fast coordinator
+    assert fast_data["battery_percentage"] is not None
+    assert fast_data["this_month"] == 123.45
+    assert not {"meter_serial", "firmware_version", "ir_power"} & fast_data.keys()
+
+    # Device information and UART parameters stay with the slow coordinator
+    assert slow_data["meter_serial"] == "11722779"
+    assert slow_data["firmware_version"] == "1.2.3"
+    assert slow_data["ir_power"] == "3"
+    assert slow_data["baud_rate"] == 300
+    assert not {"energy_plus", "battery_percentage", "this_month"} & slow_data.keys()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_changed_keys(hass: HomeAssistant, mock_api_client):
+    """Test that only the values differing from the last update are flagged."""
+    coordinator = OneMeterUpdateCoordinator(
+        hass=hass,
+        client=mock_api_client,
+        refresh_interval=DEFAULT_REFRESH_INTERVAL,
+        name="Test Device",
+        device_id="device123456",
+    )
+
+    # Every value is new on the first update
     await coordinator.async_refresh()
+    assert coordinator.changed_keys == frozenset(coordinator.data)
 
-    # Check that the coordinator properly handled the exception
-    assert coordinator.last_update_success is False
+    # Nothing changed on an identical update
+    await coordinator.async_refresh()
+    assert coordinator.changed_keys == frozenset()
+
+    # Only the energy reading changed
+    mock_api_client.get_obis_values.return_value = {
+        **mock_api_client.get_obis_values.return_value,
+        "1_8_0": 1240.0,
+    }
+    await coordinator.async_refresh()
+    assert coordinator.changed_keys == frozenset({"energy_plus"})
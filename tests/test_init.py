@@ -1,6 +1,7 @@
 """Tests for the OneMeter integration initialization."""
 from __future__ import annotations
 
+from contextlib import nullcontext
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -15,90 +16,90 @@ from custom_components.onemeter import (
 )
 from custom_components.onemeter.const import DOMAIN, PLATFORMS
 
+_VERIFY = "custom_components.onemeter._verify_api_connection"
 
-@pytest.mark.asyncio
-async def test_verify_api_connection_success():
-    """Test successful API connection verification."""
-    # Create mock client with successful response
-    client = AsyncMock()
-    client.get_device_data = AsyncMock(return_value={"data": "valid"})
-
-    # This should not raise an exception
-    await _verify_api_connection(client)
 
-    # Verify API was called
-    client.get_device_data.assert_called_once()
+@pytest.fixture(scope="module", autouse=True)
+def _patch_client():
+    """Patch the API client class once for the whole module."""
+    with patch("custom_components.onemeter.OneMeterApiClient") as mock_class:
+        yield mock_class
 
 
-@pytest.mark.asyncio
-async def test_verify_api_connection_failure():
-    """Test API connection verification with failure."""
-    # Create mock client with empty response
-    client = AsyncMock()
-    client.get_device_data = AsyncMock(return_value={})
-
-    # Should raise ConfigEntryNotReady
-    with pytest.raises(ConfigEntryNotReady):
-        await _verify_api_connection(client)
-
-    # Verify API was called
-    client.get_device_data.assert_called_once()
+@pytest.fixture
+def mock_api_client_class(_patch_client):
+    """Return the patched API client class, cleared of earlier calls."""
+    _patch_client.reset_mock(return_value=True, side_effect=True)
+    return _patch_client
 
 
-@pytest.mark.asyncio
-async def test_verify_api_connection_exception():
-    """Test API connection verification with exception."""
-    # Create mock client that raises exception
-    client = AsyncMock()
-    client.get_device_data = AsyncMock(side_effect=Exception("API error"))
-
-    # Should raise ConfigEntryNotReady
-    with pytest.raises(ConfigEntryNotReady):
+@pytest.mark.parametrize(
+    ("result", "raises"),
+    [
+        ({"data": "valid"}, None),
+        ({}, ConfigEntryNotReady),
+        # Errors are only wrapped in ConfigEntryNotReady by async_setup_entry
+        (Exception("API error"), Exception),
+    ],
+    ids=["success", "failure", "exception"],
+)
+@pytest.mark.asyncio(loop_scope="session")
+async def test_verify_api_connection(done_future, result, raises):
+    """Test API connection verification."""
+    client = MagicMock()
+    client.get_device_data = MagicMock(return_value=done_future(result))
+
+    # Empty responses raise ConfigEntryNotReady and errors propagate
+    with pytest.raises(raises) if raises else nullcontext():
         await _verify_api_connection(client)
 
     # Verify API was called
-    client.get_device_data.assert_called_once()
+    assert client.get_device_data.call_count == 1
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio
-async def test_setup_entry_success(hass: HomeAssistant, mock_config_entry):
+async def test_setup_entry_success(
+    hass: HomeAssistant, mock_config_entry, mock_api_client_class
+):
     """Test successful setup of a config entry."""
-    # Mock the API client
-    with patch(
-        "custom_components.onemeter.OneMeterApiClient"
-    ) as mock_api_client_class, patch(
-        "custom_components.onemeter._verify_api_connection"
-    ) as mock_verify:
+    with patch(_VERIFY) as mock_verify, patch.object(
+        hass.config_entries,
+        "async_forward_entry_setups",
+        AsyncMock(return_value=True),
+    ) as mock_forward:
         # Set up mock client
-        mock_client = AsyncMock()
+        mock_client = MagicMock()
+        mock_client.close = AsyncMock()
         mock_api_client_class.return_value = mock_client
 
         # Call setup_entry
         assert await async_setup_entry(hass, mock_config_entry)
 
         # Verify API client was created
-        mock_api_client_class.assert_called_once()
+        assert mock_api_client_class.call_count == 1
 
         # Verify connection was verified
-        mock_verify.assert_called_once_with(mock_client)
+        assert mock_verify.call_count == 1
+        assert mock_verify.call_args.args == (mock_client,)
 
-        # Check that platforms were set up
-        for platform in PLATFORMS:
-            assert f"{DOMAIN}.{platform}" in hass.config.components
+        # Check that platforms were forwarded
+        assert mock_forward.await_count == 1
+        entry, platforms = mock_forward.await_args.args
+        assert entry is mock_config_entry
+        assert set(platforms) == set(PLATFORMS)
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio
-async def test_setup_entry_failure(hass: HomeAssistant, mock_config_entry):
+async def test_setup_entry_failure(
+    hass: HomeAssistant, mock_config_entry, mock_api_client_class
+):
     """Test failing setup of a config entry."""
-    # Mock the API client
-    with patch(
-        "custom_components.onemeter.OneMeterApiClient"
-    ) as mock_api_client_class, patch(
-        "custom_components.onemeter._verify_api_connection",
-        side_effect=ConfigEntryNotReady("Connection failed")
-    ):
+    with patch(_VERIFY, side_effect=ConfigEntryNotReady("Connection failed")):
         # Set up mock client
-        mock_client = AsyncMock()
+        mock_client = MagicMock()
+        mock_client.close = AsyncMock()
         mock_api_client_class.return_value = mock_client
 
         # Setup should raise ConfigEntryNotReady
@@ -106,27 +107,33 @@ async def test_setup_entry_failure(hass: HomeAssistant, mock_config_entry):
             await async_setup_entry(hass, mock_config_entry)
 
         # Verify client was closed on failure
-        mock_client.close.assert_called_once()
+        assert mock_client.close.call_count == 1
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_unload_entry(hass: HomeAssistant, mock_config_entry):
     """Test unloading a config entry."""
-    # First set up the entry
-    with patch("custom_components.onemeter.async_setup_entry", return_value=True):
-        # Mock that platforms are loaded
-        for platform in PLATFORMS:
-            hass.config.components.add(f"{platform}.{DOMAIN}")
-
+    # Short-circuit platform unloading
+    with patch.object(
+        hass.config_entries,
+        "async_unload_platforms",
+        AsyncMock(return_value=True),
+    ) as mock_unload:
         # Add client to hass data
-        mock_client = AsyncMock()
+        mock_client = MagicMock()
+        mock_client.close = AsyncMock()
         hass.data[DOMAIN] = {mock_config_entry.entry_id: mock_client}
 
         # Unload the entry
         assert await async_unload_entry(hass, mock_config_entry)
 
-        # Verify client was closed
-        mock_client.close.assert_called_once()
+        # Verify platforms were unloaded and client was closed
+        assert mock_unload.await_count == 1
+        entry, platforms = mock_unload.await_args.args
+        assert entry is mock_config_entry
+        assert set(platforms) == set(PLATFORMS)
+        assert mock_client.close.call_count == 1
 
-        # Verify entry was removed from hass data
-        assert mock_config_entry.entry_id not in hass.data[DOMAIN]
+        # Verify the last entry took the domain data with it
+        assert DOMAIN not in hass.data
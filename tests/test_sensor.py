@@ -15,47 +15,87 @@ from homeassistant.const import (
 )
 from homeassistant.helpers.entity import EntityCategory
 
+from custom_components.onemeter import sensor as sensor_mod
+from custom_components.onemeter.const import DOMAIN
 from custom_components.onemeter.sensor import (
     OneMeterSensor,
     SENSOR_TYPES,
     async_setup_entry,
 )
 
+_ENERGY_DESC = SENSOR_TYPES["energy_plus"]
+_BATTERY_DESC = SENSOR_TYPES["battery_voltage"]
+_BATTERY_PCT_DESC = SENSOR_TYPES["battery_percentage"]
 
+
+@pytest.mark.fast
 def test_sensor_types():
-    """Test that sensor types are correctly defined."""
-    # Check that critical sensors are defined
-    assert "energy_plus" in SENSOR_TYPES
-    assert "power" in SENSOR_TYPES
-    assert "battery_voltage" in SENSOR_TYPES
-    assert "this_month" in SENSOR_TYPES
-    assert "previous_month" in SENSOR_TYPES
-
-    # Verify sensor configurations
-    energy_sensor = SENSOR_TYPES["energy_plus"]
-    assert energy_sensor.native_unit_of_measurement == UnitOfEnergy.KILO_WATT_HOUR
-    assert energy_sensor.device_class == SensorDeviceClass.ENERGY
-    assert energy_sensor.state_class == SensorStateClass.TOTAL_INCREASING
-
-    power_sensor = SENSOR_TYPES["power"]
-    assert power_sensor.native_unit_of_measurement == UnitOfPower.KILO_WATT
-    assert power_sensor.device_class == SensorDeviceClass.POWER
-    assert power_sensor.state_class == SensorStateClass.MEASUREMENT
-
-    battery_sensor = SENSOR_TYPES["battery_voltage"]
-    assert battery_sensor.native_unit_of_measurement == UnitOfElectricPotential.VOLT
-    assert battery_sensor.device_class == SensorDeviceClass.VOLTAGE
-    assert battery_sensor.entity_category == EntityCategory.DIAGNOSTIC
+    """Test that critical sensor types are defined."""
+    assert {"energy_plus", "power", "battery_voltage"} <= SENSOR_TYPES.keys()
 
 
-@pytest.mark.asyncio
-async def test_sensor_creation(hass, mock_coordinator):
+@pytest.mark.fast
+@pytest.mark.parametrize("key", list(SENSOR_TYPES))
+def test_sensor_type_key_matches(key):
+    """Test that each sensor description is keyed by its own key."""
+    description = SENSOR_TYPES[key]
+    assert description.key == key
+    assert description.name is not None
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("key", ["energy_plus", "energy_minus", "energy_abs"])
+def test_energy_sensor_types(key):
+    """Test that active energy sensors are total increasing kWh counters."""
+    description = SENSOR_TYPES[key]
+    assert description.native_unit_of_measurement == UnitOfEnergy.KILO_WATT_HOUR
+    assert description.device_class == SensorDeviceClass.ENERGY
+    assert description.state_class == SensorStateClass.TOTAL_INCREASING
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    ("key", "unit", "device_class", "state_class", "entity_category"),
+    [
+        (
+            "energy_plus",
+            UnitOfEnergy.KILO_WATT_HOUR,
+            SensorDeviceClass.ENERGY,
+            SensorStateClass.TOTAL_INCREASING,
+            None,
+        ),
+        (
+            "power",
+            UnitOfPower.KILO_WATT,
+            SensorDeviceClass.POWER,
+            SensorStateClass.MEASUREMENT,
+            None,
+        ),
+        (
+            "battery_voltage",
+            UnitOfElectricPotential.VOLT,
+            SensorDeviceClass.VOLTAGE,
+            SensorStateClass.MEASUREMENT,
+            EntityCategory.DIAGNOSTIC,
+        ),
+    ],
+)
+def test_sensor_type_config(key, unit, device_class, state_class, entity_category):
+    """Test that sensor configurations are correctly defined."""
+    description = SENSOR_TYPES[key]
+    assert description.native_unit_of_measurement == unit
+    assert description.device_class == device_class
+    assert description.state_class == state_class
+    assert description.entity_category == entity_category
+
+
+@pytest.mark.fast
+def test_sensor_creation(mock_coordinator):
     """Test creating a sensor entity."""
     # Create a sensor
-    description = SENSOR_TYPES["energy_plus"]
     sensor = OneMeterSensor(
         coordinator=mock_coordinator,
-        description=description,
+        description=_ENERGY_DESC,
         entry_id="test_entry_id",
         device_id="test-device-id"
     )
@@ -71,14 +111,13 @@ async def test_sensor_creation(hass, mock_coordinator):
     assert sensor.available is True
 
 
-@pytest.mark.asyncio
-async def test_diagnostic_sensor_creation(hass, mock_coordinator):
+@pytest.mark.fast
+def test_diagnostic_sensor_creation(mock_coordinator):
     """Test creating a diagnostic sensor entity."""
     # Create a diagnostic sensor
-    description = SENSOR_TYPES["battery_voltage"]
     sensor = OneMeterSensor(
         coordinator=mock_coordinator,
-        description=description,
+        description=_BATTERY_DESC,
         entry_id="test_entry_id",
         device_id="test-device-id"
     )
@@ -88,14 +127,13 @@ async def test_diagnostic_sensor_creation(hass, mock_coordinator):
     assert sensor.native_value == 3.6
 
 
-@pytest.mark.asyncio
-async def test_computed_sensor(hass, mock_coordinator):
+@pytest.mark.fast
+def test_computed_sensor(mock_coordinator):
     """Test sensor with computed value."""
     # Battery percentage is computed from voltage
-    description = SENSOR_TYPES["battery_percentage"]
     sensor = OneMeterSensor(
         coordinator=mock_coordinator,
-        description=description,
+        description=_BATTERY_PCT_DESC,
         entry_id="test_entry_id",
         device_id="test-device-id"
     )
@@ -103,18 +141,40 @@ async def test_computed_sensor(hass, mock_coordinator):
     assert sensor.native_value == 95
 
 
-@pytest.mark.asyncio
-async def test_sensor_unavailable_state(hass):
+@pytest.mark.fast
+def test_sensor_writes_only_changed_state(mock_coordinator):
+    """Test that the sensor only writes state when its value changed."""
+    sensor = OneMeterSensor(
+        coordinator=mock_coordinator,
+        description=_ENERGY_DESC,
+        entry_id="test_entry_id",
+        device_id="test-device-id"
+    )
+
+    with patch.object(sensor, "async_write_ha_state") as mock_write:
+        mock_coordinator.changed_keys = frozenset({"power"})
+        sensor._handle_coordinator_update()
+        mock_write.assert_not_called()
+
+        mock_coordinator.data = {**mock_coordinator.data, "energy_plus": 12350.0}
+        mock_coordinator.changed_keys = frozenset({"energy_plus"})
+        sensor._handle_coordinator_update()
+        mock_write.assert_called_once()
+
+    assert sensor.native_value == 12350.0
+
+
+@pytest.mark.fast
+def test_sensor_unavailable_state():
     """Test sensor behavior when coordinator has no data."""
     # Create coordinator with no data
     coordinator = MagicMock()
     coordinator.data = None
     coordinator.name = "Test OneMeter"
 
-    description = SENSOR_TYPES["energy_plus"]
     sensor = OneMeterSensor(
         coordinator=coordinator,
-        description=description,
+        description=_ENERGY_DESC,
         entry_id="test_entry_id",
         device_id="test-device-id"
     )
@@ -123,44 +183,96 @@ async def test_sensor_unavailable_state(hass):
 
 
 @pytest.mark.asyncio
-async def test_async_setup_entry(hass, mock_config_entry, mock_api_client):
+async def test_async_setup_entry(
+    hass, mock_config_entry, stub_api_client, coordinator_data
+):
     """Test setting up sensors from a config entry."""
+    # The API client is created by the integration setup
+    hass.data[DOMAIN] = {mock_config_entry.entry_id: stub_api_client}
+
     # Mock coordinator
-    with patch(
-        "custom_components.onemeter.sensor.OneMeterUpdateCoordinator", autospec=True
-    ) as mock_coordinator_class, patch(
-        "custom_components.onemeter.sensor.OneMeterApiClient", return_value=mock_api_client
-    ), patch(
-        "custom_components.onemeter.sensor.async_add_entities"
-    ) as mock_async_add_entities:
-        # Set up mock coordinator instance
+    mock_async_add_entities = MagicMock()
+    with patch.object(
+        sensor_mod, "OneMeterUpdateCoordinator"
+    ) as mock_coordinator_class, patch.object(
+        sensor_mod, "OneMeterSlowCoordinator"
+    ) as mock_slow_coordinator_class:
+        # Set up mock coordinator instances, skipping the initial API fetch
         mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.data = {
-            "energy_plus": 12345.67,
-            "power": 2.5,
-            "battery_voltage": 3.6,
-            "battery_percentage": 95,
+        mock_coordinator.async_config_entry_first_refresh = AsyncMock(return_value=None)
+        mock_slow_coordinator = mock_slow_coordinator_class.return_value
+        mock_slow_coordinator.async_refresh = AsyncMock(return_value=None)
+        mock_slow_coordinator.last_update_success = True
+        mock_coordinator.data = coordinator_data
+        mock_slow_coordinator.data = {
             "meter_serial": "11722779",
-            "tariff": "G11",
-            "this_month": 123.45,
-            "previous_month": 234.56,
         }
 
         # Call setup
         await async_setup_entry(hass, mock_config_entry, mock_async_add_entities)
 
-        # Check that coordinator was created
+        # Check that coordinators were created with the shared client
         mock_coordinator_class.assert_called_once()
+        assert mock_coordinator_class.call_args.kwargs["client"] is stub_api_client
+        mock_slow_coordinator_class.assert_called_once()
+        mock_coordinator.async_config_entry_first_refresh.assert_awaited_once()
+        mock_slow_coordinator.async_refresh.assert_awaited_once()
 
         # Check that entities were added
         mock_async_add_entities.assert_called_once()
         # Get the entities that were added
-        entities = mock_async_add_entities.call_args[0][0]
+        entities = list(mock_async_add_entities.call_args[0][0])
         # Verify that entities were created for each sensor in the coordinator data
         assert len(entities) >= 8  # Should have at least the 8 sensors in our mock data
 
         # Verify sensor types
-        entity_keys = set(entity.entity_description.key for entity in entities)
-        assert "energy_plus" in entity_keys
-        assert "power" in entity_keys
-        assert "battery_voltage" in entity_keys
+        entity_keys = {entity.entity_description.key for entity in entities}
+        assert {"energy_plus", "power", "battery_voltage", "meter_serial"}.issubset(
+            entity_keys
+        )
+
+        # Verify all entities share one device info object
+        assert all(entity.device_info is entities[0].device_info for entity in entities)
+
+
+@pytest.mark.asyncio
+async def test_async_setup_entry_slow_refresh_failed(
+    hass, mock_config_entry, stub_api_client, coordinator_data
+):
+    """Test that a failed slow refresh only delays the rarely changing sensors."""
+    hass.data[DOMAIN] = {mock_config_entry.entry_id: stub_api_client}
+
+    mock_async_add_entities = MagicMock()
+    with patch.object(
+        sensor_mod, "OneMeterUpdateCoordinator"
+    ) as mock_coordinator_class, patch.object(
+        sensor_mod, "OneMeterSlowCoordinator"
+    ) as mock_slow_coordinator_class:
+        mock_coordinator = mock_coordinator_class.return_value
+        mock_coordinator.async_config_entry_first_refresh = AsyncMock(return_value=None)
+        mock_coordinator.data = coordinator_data
+        mock_slow_coordinator = mock_slow_coordinator_class.return_value
+        mock_slow_coordinator.async_refresh = AsyncMock(return_value=None)
+        mock_slow_coordinator.last_update_success = False
+        mock_slow_coordinator.data = None
+
+        # Setup succeeds with the frequently polled sensors only
+        await async_setup_entry(hass, mock_config_entry, mock_async_add_entities)
+
+        entities = list(mock_async_add_entities.call_args[0][0])
+        assert "meter_serial" not in {
+            entity.entity_description.key for entity in entities
+        }
+
+        # The slow sensors are added once a retried refresh succeeds
+        listener = mock_slow_coordinator.async_add_listener.call_args[0][0]
+        mock_slow_coordinator.last_update_success = True
+        mock_slow_coordinator.data = {"meter_serial": "11722779"}
+        listener()
+        listener()
+
+        assert mock_async_add_entities.call_count == 2
+        slow_entities = list(mock_async_add_entities.call_args[0][0])
+        assert [entity.entity_description.key for entity in slow_entities] == [
+            "meter_serial"
+        ]